@@ -805,6 +805,9 @@ def run_analysis():
     config["deep_think_llm"] = selections["deep_thinker"]
     config["backend_url"] = selections["backend_url"]
     config["llm_provider"] = selections["llm_provider"].lower()
+    # The live panels follow the analysts' messages, which parallel analysts
+    # keep inside their own subgraphs
+    config["parallel_analysts"] = False
 
     # Initialize the graph (delayed import to avoid packaging issues)
     try:
@@ -0,0 +1,66 @@
+import os
+import threading
+
+import pytest
+
+from tradingagents.graph.trading_graph import TradingAgentsGraph, _shard_batch_jobs
+
+DATES = ["2024-03-01", "2024-03-04", "2024-03-05", "2024-03-06", "2024-03-07"]
+
+
+class PidGraph(TradingAgentsGraph):
+    """Graph whose runs report the process they ran in instead of calling any model."""
+
+    def __init__(self, selected_analysts=(), debug=False, config=None):
+        self.selected_analysts = list(selected_analysts)
+        self.debug = debug
+        self.config = config or {}
+        self.log_states_dict = {}
+        self._log_lock = threading.Lock()
+
+    def _run_graph(self, company_name, trade_date):
+        return {"pid": os.getpid(), "final_trade_decision": "BUY"}
+
+    def _log_state(self, trade_date, final_state):
+        pass
+
+    def _log_entry(self, final_state):
+        return final_state
+
+    def process_signal(self, full_signal):
+        return full_signal
+
+
+@pytest.mark.parametrize(
+    "tickers, dates, workers, expected_shards",
+    [
+        (["AAPL"], DATES, 4, 4),
+        (["AAPL"], DATES[:2], 4, 2),
+        (["AAPL", "NVDA"], DATES, 4, 4),
+        (["AAPL", "NVDA", "MSFT", "TSLA"], DATES, 2, 2),
+        (["AAPL"], DATES, 1, 1),
+        (["AAPL"], [], 4, 0),
+    ],
+)
+def test_shard_batch_jobs(tickers, dates, workers, expected_shards):
+    shards = _shard_batch_jobs(tickers, dates, workers)
+
+    assert len(shards) == expected_shards
+    jobs = [job for shard in shards for job in shard]
+    assert sorted(jobs) == sorted((ticker, date) for ticker in tickers for date in dates)
+
+
+def test_shard_batch_jobs_keeps_tickers_together_when_there_are_enough():
+    shards = _shard_batch_jobs(["AAPL", "NVDA", "MSFT", "TSLA"], DATES, 4)
+
+    assert sorted(len({ticker for ticker, _date in shard}) for shard in shards) == [1, 1, 1, 1]
+
+
+def test_single_ticker_batch_uses_several_processes():
+    graph = PidGraph()
+
+    results = list(graph.propagate_batch("AAPL", DATES[:4], max_concurrency=2, processes=True))
+
+    assert [result.error for result in results] == [None] * 4
+    assert sorted(result.trade_date for result in results) == DATES[:4]
+    assert len({result.final_state["pid"] for result in results}) == 2
@@ -0,0 +1,73 @@
+import pytest
+
+from tradingagents.graph.signal_processing import SignalDecision, extract_decision
+
+
+@pytest.mark.parametrize(
+    "signal, expected",
+    [
+        # Marker
+        ("Momentum is strong.\n\nFINAL TRANSACTION PROPOSAL: **BUY**", ("BUY", "marker")),
+        ("final transaction proposal: sell", ("SELL", "marker")),
+        ("**FINAL TRANSACTION PROPOSAL**: Hold", ("HOLD", "marker")),
+        ("FINAL TRANSACTION PROPOSAL: BUY\n...\nFINAL TRANSACTION PROPOSAL: SELL", ("SELL", "marker")),
+        ("综合来看，最终交易提案：**卖出**", ("SELL", "marker")),
+        ("最终交易建议: 持有", ("HOLD", "marker")),
+        # Quoted marker
+        ('FINAL TRANSACTION PROPOSAL: "Sell"', ("SELL", "marker")),
+        ("FINAL TRANSACTION PROPOSAL: `HOLD`", ("HOLD", "marker")),
+        ("最终交易提案：「买入」", ("BUY", "marker")),
+        # A later statement agreeing with the marker keeps it decisive
+        (
+            "The trader proposed FINAL TRANSACTION PROPOSAL: **SELL**. Recommendation: Sell",
+            ("SELL", "marker"),
+        ),
+        # Label
+        ("After weighing both sides.\n\nRecommendation: Sell", ("SELL", "label")),
+        ("**Final Decision**: **Hold**", ("HOLD", "label")),
+        ("Verdict - Buy", ("BUY", "label")),
+        ("建议：买入", ("BUY", "label")),
+        ("结论: 持有", ("HOLD", "label")),
+        ("Recommendation: Sell. We therefore **Sell** into strength.", ("SELL", "label")),
+        # Bold
+        ("We **Buy** on the dip and keep adding; **Buy** remains the call.", ("BUY", "emphasis")),
+        ("**持有**，继续**持有**", ("HOLD", "emphasis")),
+    ],
+)
+def test_extract_decision(signal, expected):
+    assert extract_decision(signal) == SignalDecision(*expected)
+
+
+@pytest.mark.parametrize(
+    "signal",
+    [
+        # Nothing to go on
+        "",
+        None,
+        "The outlook is mixed and the team could not agree.",
+        # List of options rather than a decision
+        "Rate the stock as Buy/Hold/Sell.",
+        "Recommendation: Buy/Hold/Sell",
+        "Decision: Buy, Hold or Sell depending on earnings",
+        "建议：买入、持有或卖出",
+        "Recommendation: Buy or Sell after the report",
+        # Conflicting statements
+        "Recommendation: Buy\n\nDecision: Sell",
+        "Recommendation: Buy, but we would **Sell** half.",
+        "**Buy** the rumor, **Sell** the news.",
+        # The judge quotes the trader's marker and then overrules it
+        "The trader's FINAL TRANSACTION PROPOSAL: **BUY** ignores the risks. Recommendation: Sell",
+        "Trader: FINAL TRANSACTION PROPOSAL: BUY. I disagree and would **Hold**.",
+        # A lone bold word
+        "Given the valuation we lean to **Hold**.",
+        # Negation
+        "We should not **Buy** now; instead we recommend holding.",
+        "Don't **Sell** yet. **Hold** is safer.",
+        "Avoid **Buy** here and **Buy** only after the earnings call.",
+        "现在不要**买入**，**持有**更稳妥。",
+        # Decision words inside longer words
+        "Buyers and sellers are balanced; holdings are unchanged.",
+    ],
+)
+def test_extract_decision_ambiguous(signal):
+    assert extract_decision(signal) is None
@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+from tradingagents.agents.utils.memory import create_situation_embedder, situation_text
+
+EMBEDDING_SECONDS = 0.5
+
+STATE = {
+    "market_report": "m",
+    "sentiment_report": "s",
+    "news_report": "n",
+    "fundamentals_report": "f",
+}
+EMBEDDING = [float(len(situation_text(STATE)))]
+
+
+class SlowMemory:
+    """Memory whose embedding request blocks like a network call."""
+
+    def get_embedding(self, text, strict=False):
+        time.sleep(EMBEDDING_SECONDS)
+        return [float(len(text))]
+
+
+def test_situation_embedding_sync():
+    node = create_situation_embedder(SlowMemory())
+
+    assert node.invoke(STATE) == {"situation_embedding": EMBEDDING}
+
+
+def test_situation_embedding_does_not_block_the_event_loop():
+    async def heartbeat(stop):
+        # Longest time the loop went without running this coroutine
+        longest, last = 0.0, time.monotonic()
+        while not stop.is_set():
+            await asyncio.sleep(0.01)
+            now = time.monotonic()
+            longest, last = max(longest, now - last), now
+        return longest
+
+    async def main():
+        node = create_situation_embedder(SlowMemory())
+        stop = asyncio.Event()
+        beat = asyncio.create_task(heartbeat(stop))
+        started = time.monotonic()
+        results = await asyncio.gather(*(node.ainvoke(STATE) for _ in range(4)))
+        elapsed = time.monotonic() - started
+        stop.set()
+        return results, elapsed, await beat
+
+    results, elapsed, longest_stall = asyncio.run(main())
+
+    assert results == [{"situation_embedding": EMBEDDING}] * 4
+    assert longest_stall < EMBEDDING_SECONDS / 2
+    # The four runs embed concurrently instead of one after another
+    assert elapsed < 4 * EMBEDDING_SECONDS
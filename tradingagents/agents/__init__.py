@@ -1,6 +1,7 @@
 from .utils.agent_utils import Toolkit, create_msg_delete
 from .utils.agent_states import AgentState, InvestDebateState, RiskDebateState
-from .utils.memory import FinancialSituationMemory
+from .utils.memory import FinancialSituationMemory, create_memory
+from .utils.vector_memory import NumpySituationMemory
 
 from .analysts.fundamentals_analyst import create_fundamentals_analyst
 from .analysts.market_analyst import create_market_analyst
@@ -21,6 +22,8 @@ from .trader.trader import create_trader
 
 __all__ = [
     "FinancialSituationMemory",
+    "NumpySituationMemory",
+    "create_memory",
     "Toolkit",
     "AgentState",
     "create_msg_delete",
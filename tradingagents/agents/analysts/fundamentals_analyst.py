@@ -2,6 +2,7 @@ from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
 from tradingagents.i18n import _
+from tradingagents.agents.utils.agent_utils import create_llm_node
 
 
 def create_fundamentals_analyst(llm, toolkit):
@@ -16,6 +17,7 @@ def create_fundamentals_analyst(llm, toolkit):
             tools = [
                 toolkit.get_finnhub_company_insider_sentiment,
                 toolkit.get_finnhub_company_insider_transactions,
+                toolkit.get_simfin_fundamentals,
                 toolkit.get_simfin_balance_sheet,
                 toolkit.get_simfin_cashflow,
                 toolkit.get_simfin_income_stmt,
@@ -44,7 +46,7 @@ def create_fundamentals_analyst(llm, toolkit):
 
         chain = prompt | llm.bind_tools(tools)
 
-        result = chain.invoke(state["messages"])
+        result = yield chain, state["messages"]
 
         report = ""
 
@@ -56,4 +58,4 @@ def create_fundamentals_analyst(llm, toolkit):
             "fundamentals_report": report,
         }
 
-    return fundamentals_analyst_node
+    return create_llm_node(fundamentals_analyst_node)
@@ -2,6 +2,7 @@ from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
 from tradingagents.i18n import _
+from tradingagents.agents.utils.agent_utils import create_llm_node
 
 
 def create_market_analyst(llm, toolkit):
@@ -15,17 +16,23 @@ def create_market_analyst(llm, toolkit):
             tools = [
                 toolkit.get_YFin_data_online,
                 toolkit.get_stockstats_indicators_report_online,
+                toolkit.get_stockstats_indicators_batch_report_online,
             ]
         else:
             tools = [
                 toolkit.get_YFin_data,
                 toolkit.get_stockstats_indicators_report,
+                toolkit.get_stockstats_indicators_batch_report,
             ]
 
         system_message = (
             _("agents.market_analyst.role") + "\n\n" +
             _("agents.market_analyst.indicators_description") + "\n\n" +
-            _("agents.market_analyst.select_indicators_instruction") + "\n\n" +
+            _(
+                "agents.market_analyst.select_indicators_instruction",
+                price_tool=tools[0].name,
+                batch_tool=tools[2].name,
+            ) + "\n\n" +
             _("agents.market_analyst.report_instruction")
         )
 
@@ -48,7 +55,7 @@ def create_market_analyst(llm, toolkit):
 
         chain = prompt | llm.bind_tools(tools)
 
-        result = chain.invoke(state["messages"])
+        result = yield chain, state["messages"]
 
         report = ""
 
@@ -60,4 +67,4 @@ def create_market_analyst(llm, toolkit):
             "market_report": report,
         }
 
-    return market_analyst_node
+    return create_llm_node(market_analyst_node)
@@ -1,6 +1,7 @@
 import time
 import json
 from tradingagents.i18n import _, get_locale
+from tradingagents.agents.utils.agent_utils import create_llm_node
 
 
 def create_research_manager(llm, memory):
@@ -14,7 +15,11 @@ def create_research_manager(llm, memory):
         investment_debate_state = state["investment_debate_state"]
 
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = memory.get_memories(
+            curr_situation,
+            n_matches=2,
+            query_embedding=state.get("situation_embedding"),
+        )
 
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
@@ -65,7 +70,7 @@ Here are your past reflections on mistakes:
 Here is the debate:
 Debate History:
 {history}"""
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         new_investment_debate_state = {
             "judge_decision": response.content,
@@ -81,4 +86,4 @@ Debate History:
             "investment_plan": response.content,
         }
 
-    return research_manager_node
+    return create_llm_node(research_manager_node)
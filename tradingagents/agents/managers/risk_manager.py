@@ -1,6 +1,7 @@
 import time
 import json
 from tradingagents.i18n import _, get_locale
+from tradingagents.agents.utils.agent_utils import create_llm_node
 
 
 def create_risk_manager(llm, memory):
@@ -12,12 +13,16 @@ def create_risk_manager(llm, memory):
         risk_debate_state = state["risk_debate_state"]
         market_research_report = state["market_report"]
         news_report = state["news_report"]
-        fundamentals_report = state["news_report"]
+        fundamentals_report = state["fundamentals_report"]
         sentiment_report = state["sentiment_report"]
         trader_plan = state["investment_plan"]
 
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = memory.get_memories(
+            curr_situation,
+            n_matches=2,
+            query_embedding=state.get("situation_embedding"),
+        )
 
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
@@ -30,7 +35,7 @@ def create_risk_manager(llm, memory):
             history=history
         )
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         new_risk_debate_state = {
             "judge_decision": response.content,
@@ -50,4 +55,4 @@ def create_risk_manager(llm, memory):
             "final_trade_decision": response.content,
         }
 
-    return risk_manager_node
+    return create_llm_node(risk_manager_node)
@@ -2,6 +2,7 @@ from langchain_core.messages import AIMessage
 import time
 import json
 from tradingagents.i18n import _, get_locale
+from tradingagents.agents.utils.agent_utils import create_llm_node
 
 
 def create_bear_researcher(llm, memory):
@@ -17,7 +18,11 @@ def create_bear_researcher(llm, memory):
         fundamentals_report = state["fundamentals_report"]
 
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = memory.get_memories(
+            curr_situation,
+            n_matches=2,
+            query_embedding=state.get("situation_embedding"),
+        )
 
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
@@ -79,7 +84,7 @@ Reflections from similar situations and lessons learned: {past_memory_str}
 Use this information to deliver a compelling bear argument, refute the bull's claims, and engage in a dynamic debate that demonstrates the risks and weaknesses of investing in the stock. You must also address reflections and learn from lessons and mistakes you made in the past.
 """
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         argument = f"{_('team.roles.bear_researcher')}: {response.content}"
 
@@ -93,4 +98,4 @@ Use this information to deliver a compelling bear argument, refute the bull's cl
 
         return {"investment_debate_state": new_investment_debate_state}
 
-    return bear_node
+    return create_llm_node(bear_node)
@@ -1,6 +1,7 @@
 import time
 import json
 from tradingagents.i18n import _, get_locale
+from tradingagents.agents.utils.agent_utils import create_llm_node
 
 
 def create_risky_debator(llm):
@@ -34,7 +35,7 @@ def create_risky_debator(llm):
             current_neutral_response=current_neutral_response
         )
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         argument = f"{_('team.roles.risk_analyst_risky')}: {response.content}"
 
@@ -54,4 +55,4 @@ def create_risky_debator(llm):
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return risky_node
+    return create_llm_node(risky_node)
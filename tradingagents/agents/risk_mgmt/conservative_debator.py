@@ -2,6 +2,7 @@ from langchain_core.messages import AIMessage
 import time
 import json
 from tradingagents.i18n import _, get_locale
+from tradingagents.agents.utils.agent_utils import create_llm_node
 
 
 def create_safe_debator(llm):
@@ -35,7 +36,7 @@ def create_safe_debator(llm):
             current_neutral_response=current_neutral_response
         )
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         argument = f"{_('team.roles.risk_analyst_safe')}: {response.content}"
 
@@ -57,4 +58,4 @@ def create_safe_debator(llm):
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return safe_node
+    return create_llm_node(safe_node)
@@ -1,6 +1,7 @@
 import time
 import json
 from tradingagents.i18n import _, get_locale
+from tradingagents.agents.utils.agent_utils import create_llm_node
 
 
 def create_neutral_debator(llm):
@@ -31,7 +32,7 @@ def create_neutral_debator(llm):
             current_safe_response=current_safe_response
         )
 
-        response = llm.invoke(prompt)
+        response = yield llm, prompt
 
         argument = f"{_('team.roles.risk_analyst_neutral')}: {response.content}"
 
@@ -51,4 +52,4 @@ def create_neutral_debator(llm):
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return neutral_node
+    return create_llm_node(neutral_node)
@@ -2,6 +2,7 @@ import functools
 import time
 import json
 from tradingagents.i18n import _, get_locale
+from tradingagents.agents.utils.agent_utils import create_llm_node
 
 
 def create_trader(llm, memory):
@@ -14,7 +15,11 @@ def create_trader(llm, memory):
         fundamentals_report = state["fundamentals_report"]
 
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
+        past_memories = memory.get_memories(
+            curr_situation,
+            n_matches=2,
+            query_embedding=state.get("situation_embedding"),
+        )
 
         past_memory_str = ""
         if past_memories:
@@ -62,7 +67,7 @@ def create_trader(llm, memory):
                 context,
             ]
 
-        result = llm.invoke(messages)
+        result = yield llm, messages
 
         return {
             "messages": [result],
@@ -70,4 +75,4 @@ def create_trader(llm, memory):
             "sender": name,
         }
 
-    return functools.partial(trader_node, name="Trader")
+    return create_llm_node(functools.partial(trader_node, name="Trader"))
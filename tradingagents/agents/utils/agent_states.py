@@ -1,4 +1,4 @@
-from typing import Annotated, Sequence
+from typing import Annotated, List, Sequence
 from datetime import date, timedelta, datetime
 from typing_extensions import TypedDict, Optional
 from langchain_openai import ChatOpenAI
@@ -60,6 +60,9 @@ class AgentState(MessagesState):
         str, "Report from the News Researcher of current world affairs"
     ]
     fundamentals_report: Annotated[str, "Report from the Fundamentals Researcher"]
+    situation_embedding: Annotated[
+        Optional[List[float]], "Embedding of the analyst reports, shared by all memory lookups"
+    ]
 
     # researcher team discussion step
     investment_debate_state: Annotated[
@@ -4,6 +4,7 @@ from typing import Annotated
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import RemoveMessage
 from langchain_core.tools import tool
+from langchain_core.runnables import RunnableLambda
 from datetime import date, timedelta, datetime
 import functools
 import pandas as pd
@@ -15,6 +16,7 @@ from tradingagents.config_manager import get_config
 from langchain_core.messages import HumanMessage
 from tradingagents.i18n import _, init_i18n, get_i18n_manager
 from tradingagents.config_manager import get_config
+from tradingagents.agents.utils.tool_cache import memoize_toolkit
 
 
 def create_msg_delete():
@@ -40,6 +42,37 @@ def create_msg_delete():
     return delete_messages
 
 
+def create_llm_node(node):
+    """Turn an agent node written as a generator into a graph node with sync and async paths.
+
+    The node yields its model call as ``(runnable, input)`` and receives the
+    model output back, e.g. ``response = yield llm, prompt``. The sync path
+    resolves the call with ``invoke``; the async path used by ``apropagate``
+    awaits ``ainvoke`` so many runs can share one event loop.
+    """
+
+    def run(state):
+        steps = node(state)
+        runnable, llm_input = next(steps)
+        return _finish_llm_node(steps, runnable.invoke(llm_input))
+
+    async def arun(state):
+        steps = node(state)
+        runnable, llm_input = next(steps)
+        return _finish_llm_node(steps, await runnable.ainvoke(llm_input))
+
+    name = getattr(node, "__name__", None) or getattr(node.func, "__name__", None)
+    return RunnableLambda(run, afunc=arun, name=name)
+
+
+def _finish_llm_node(steps, result):
+    try:
+        steps.send(result)
+    except StopIteration as done:
+        return done.value
+    raise RuntimeError("Agent nodes must make exactly one model call")
+
+
 class Toolkit:
     _config = get_config().get_config()
 
@@ -228,6 +261,64 @@ class Toolkit:
 
         return result_stockstats
 
+    @staticmethod
+    @tool
+    def get_stockstats_indicators_batch_report(
+        symbol: Annotated[str, "ticker symbol of the company"],
+        indicators: Annotated[
+            List[str], "technical indicators to get the analysis and report of"
+        ],
+        curr_date: Annotated[
+            str, "The current trading date you are trading on, YYYY-mm-dd"
+        ],
+        look_back_days: Annotated[int, "how many days to look back"] = 30,
+    ) -> str:
+        """
+        Retrieve several stock stats indicators for a given ticker symbol in one table.
+        Args:
+            symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+            indicators (List[str]): Technical indicators to get the analysis and report of
+            curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+            look_back_days (int): How many days to look back, default is 30
+        Returns:
+            str: A table with one column per indicator and one row per trading day, followed by the indicator descriptions.
+        """
+
+        result_stockstats = interface.get_stock_stats_indicators_batch(
+            symbol, indicators, curr_date, look_back_days, False
+        )
+
+        return result_stockstats
+
+    @staticmethod
+    @tool
+    def get_stockstats_indicators_batch_report_online(
+        symbol: Annotated[str, "ticker symbol of the company"],
+        indicators: Annotated[
+            List[str], "technical indicators to get the analysis and report of"
+        ],
+        curr_date: Annotated[
+            str, "The current trading date you are trading on, YYYY-mm-dd"
+        ],
+        look_back_days: Annotated[int, "how many days to look back"] = 30,
+    ) -> str:
+        """
+        Retrieve several stock stats indicators for a given ticker symbol in one table.
+        Args:
+            symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+            indicators (List[str]): Technical indicators to get the analysis and report of
+            curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+            look_back_days (int): How many days to look back, default is 30
+        Returns:
+            str: A table with one column per indicator and one row per trading day, followed by the indicator descriptions.
+        """
+
+        result_stockstats = interface.get_stock_stats_indicators_batch(
+            symbol, indicators, curr_date, look_back_days, True
+        )
+
+        return result_stockstats
+
     @staticmethod
     @tool
     def get_finnhub_company_insider_sentiment(
@@ -276,6 +367,30 @@ class Toolkit:
 
         return data_trans
 
+    @staticmethod
+    @tool
+    def get_simfin_fundamentals(
+        ticker: Annotated[str, "ticker symbol"],
+        freq: Annotated[
+            str,
+            "reporting frequency of the company's financial history: annual/quarterly",
+        ],
+        curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    ):
+        """
+        Retrieve the most recent balance sheet, cash flow statement and income statement of a company in one call
+        Args:
+            ticker (str): ticker symbol of the company
+            freq (str): reporting frequency of the company's financial history: annual / quarterly
+            curr_date (str): current date you are trading at, yyyy-mm-dd
+        Returns:
+            str: a report of the company's most recent financial statements
+        """
+
+        data_fundamentals = interface.get_simfin_fundamentals(ticker, freq, curr_date)
+
+        return data_fundamentals
+
     @staticmethod
     @tool
     def get_simfin_balance_sheet(
@@ -428,6 +543,16 @@ class Toolkit:
         return openai_fundamentals_results
 
 
+# Native async counterparts used when the graph runs under apropagate. The other
+# tools only read local files and are run in a worker thread by langchain.
+Toolkit.get_stock_news_openai.coroutine = interface.aget_stock_news_openai
+Toolkit.get_global_news_openai.coroutine = interface.aget_global_news_openai
+Toolkit.get_fundamentals_openai.coroutine = interface.aget_fundamentals_openai
+
+# Repeated calls with the same arguments are answered from the tool result cache
+memoize_toolkit(Toolkit)
+
+
 def translate_tool_params(param_name: str, param_value: str) -> str:
     """
     Translate tool parameters for display in the UI.
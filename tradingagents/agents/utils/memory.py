@@ -1,7 +1,18 @@
-import chromadb
-from chromadb.config import Settings
+import asyncio
+import hashlib
+import os
+import threading
+from contextlib import contextmanager
+
+from langchain_core.runnables import RunnableLambda
+
 from tradingagents.embedding import EmbeddingManager
 
+try:
+    import fcntl
+except ImportError:  # Windows: writers are only serialized within the process
+    fcntl = None
+
 # Import i18n support
 try:
     from ...i18n import _
@@ -12,42 +23,181 @@ except ImportError:
         return key.format(**kwargs) if kwargs else key
 
 
+def memory_setting(config, key, default=None):
+    """Read a memory setting from the flat config or its memory_settings section."""
+    flat_key = f"memory_{key}"
+    if flat_key in config:
+        return config[flat_key]
+    full_config = config.get("_full_config", config)
+    return full_config.get("memory_settings", {}).get(key, default)
+
+
+def memory_dir(config):
+    """Directory holding the persistent memories, results_dir/memory by default."""
+    path = memory_setting(config, "dir")
+    if path:
+        return path
+    full_config = config.get("_full_config", config)
+    results_dir = config.get("results_dir") or full_config.get(
+        "project_settings", {}
+    ).get("results_dir", "./results")
+    return os.path.join(results_dir, "memory")
+
+
+_thread_locks = {}
+_thread_locks_lock = threading.Lock()
+
+
+@contextmanager
+def writer_lock(path):
+    """Exclusive lock of a lock file, held by one thread of one process at a time."""
+    key = os.path.abspath(path)
+    with _thread_locks_lock:
+        thread_lock = _thread_locks.setdefault(key, threading.Lock())
+    with thread_lock:
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(os.path.dirname(key), exist_ok=True)
+        with open(key, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def situation_id(situation, recommendation):
+    """Content derived id, so the same lesson is stored once however often it is added."""
+    digest = hashlib.sha256(situation.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(recommendation.encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def situation_text(state):
+    """The situation the agents look up past lessons for: the four analyst reports."""
+    return (
+        f"{state['market_report']}\n\n{state['sentiment_report']}\n\n"
+        f"{state['news_report']}\n\n{state['fundamentals_report']}"
+    )
+
+
+def create_situation_embedder(memory):
+    """Graph node embedding the current situation once per run.
+
+    The researchers, manager, trader and risk judge all query their memories
+    with the same situation, so they reuse this embedding instead of embedding
+    the reports on every lookup. All memories of a graph share one embedding
+    config, so the embedding of any of them fits every collection. The async
+    path runs the blocking embedding request in a worker thread, so it does
+    not stall the other runs sharing the event loop.
+    """
+
+    def embed_situation(state):
+        return {"situation_embedding": memory.get_embedding(situation_text(state))}
+
+    async def aembed_situation(state):
+        return await asyncio.to_thread(embed_situation, state)
+
+    return RunnableLambda(embed_situation, afunc=aembed_situation, name="embed_situation")
+
+
+def create_memory(name, config):
+    """Create an agent memory.
+
+    Persistent memories (memory_settings.persistent, the default) are always
+    NumpySituationMemory: its on-disk situation log is shared safely by every
+    process, which a persistent Chroma client is not. memory_settings.backend
+    ("chroma" or "numpy") picks the in-process index of non-persistent ones.
+    Both score matches by cosine similarity.
+    """
+    if memory_setting(config, "persistent", True) or (
+        memory_setting(config, "backend", "chroma") == "numpy"
+    ):
+        from .vector_memory import NumpySituationMemory
+
+        return NumpySituationMemory(name, config)
+    return FinancialSituationMemory(name, config)
+
+
 class FinancialSituationMemory:
+    """In-process Chroma collection of lessons, lost when the process exits."""
+
     def __init__(self, name, config):
+        # Imported here so the numpy backend does not pay for loading chromadb
+        import chromadb
+        from chromadb.config import Settings
+
         self.embedding_manager = EmbeddingManager(config)
+
+        # Vectors of different embedding models must not share a collection
+        collection_name = f"{name}-{self.embedding_manager.model_digest()}"
         self.chroma_client = chromadb.Client(Settings(allow_reset=True))
-        self.situation_collection = self.chroma_client.create_collection(name=name)
+        # Cosine distance, so similarity_score means the same as with the numpy backend
+        self.situation_collection = self.chroma_client.get_or_create_collection(
+            name=collection_name, metadata={"hnsw:space": "cosine"}
+        )
 
-    def get_embedding(self, text):
+    def get_embedding(self, text, strict=False):
         """Get embedding for a text using configured provider"""
-        return self.embedding_manager.get_embedding(text)
+        return self.embedding_manager.get_embedding(text, strict=strict)
 
-    def add_situations(self, situations_and_advice):
-        """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
+    def add_situations(self, situations_and_advice, embeddings=None):
+        """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)
 
-        situations = []
-        advice = []
-        ids = []
-        embeddings = []
+        embeddings may hold precomputed embeddings of the situations, in order;
+        otherwise all situations are embedded with batched requests. Situations
+        already stored with the same advice are skipped without re-embedding.
+        Lessons are never stored with mock fallback vectors: if the provider
+        fails, EmbeddingError is raised and nothing is added.
+        """
+        entries = {}
+        for i, (situation, recommendation) in enumerate(situations_and_advice):
+            entries.setdefault(situation_id(situation, recommendation), i)
 
-        offset = self.situation_collection.count()
+        if not entries:
+            return
 
-        for i, (situation, recommendation) in enumerate(situations_and_advice):
-            situations.append(situation)
-            advice.append(recommendation)
-            ids.append(str(offset + i))
-            embeddings.append(self.get_embedding(situation))
-
-        self.situation_collection.add(
-            documents=situations,
-            metadatas=[{"recommendation": rec} for rec in advice],
-            embeddings=embeddings,
-            ids=ids,
+        existing = set(
+            self.situation_collection.get(ids=list(entries), include=[])["ids"]
         )
+        new = [(key, i) for key, i in entries.items() if key not in existing]
+        if not new:
+            return
+
+        ids = [key for key, _i in new]
+        situations = [situations_and_advice[i][0] for _key, i in new]
+        advice = [situations_and_advice[i][1] for _key, i in new]
+        if embeddings is None:
+            new_embeddings = self.embedding_manager.get_batch_embeddings(situations, strict=True)
+        else:
+            new_embeddings = [embeddings[i] for _key, i in new]
+
+        batch_size = self._max_insert_batch()
+        for start in range(0, len(ids), batch_size):
+            end = start + batch_size
+            self.situation_collection.add(
+                documents=situations[start:end],
+                metadatas=[{"recommendation": rec} for rec in advice[start:end]],
+                embeddings=new_embeddings[start:end],
+                ids=ids[start:end],
+            )
+
+    def _max_insert_batch(self):
+        # Chroma rejects a single add larger than its client limit
+        try:
+            return self.chroma_client.get_max_batch_size()
+        except AttributeError:
+            return getattr(self.chroma_client, "max_batch_size", 5000)
+
+    def get_memories(self, current_situation, n_matches=1, query_embedding=None):
+        """Find matching recommendations using configured embeddings
 
-    def get_memories(self, current_situation, n_matches=1):
-        """Find matching recommendations using configured embeddings"""
-        query_embedding = self.get_embedding(current_situation)
+        query_embedding may hold the precomputed embedding of current_situation.
+        """
+        if query_embedding is None:
+            query_embedding = self.get_embedding(current_situation)
 
         results = self.situation_collection.query(
             query_embeddings=[query_embedding],
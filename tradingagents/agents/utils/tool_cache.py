@@ -0,0 +1,287 @@
+"""
+Memoization of Toolkit tool results.
+
+Analysts often call the same tool with the same arguments several times in a
+run, and overlapping runs repeat those calls across processes. Every Toolkit
+tool is wrapped so a call is first looked up in an in-process LRU, then in a
+SQLite tier under the dataflow cache directory, before the tool runs.
+
+Entries are keyed by data folder, output language, tool name and the
+JSON-encoded arguments. How long a result stays valid is a per-tool policy:
+the online tools get short TTLs so fresh data is fetched again, the offline
+tools read historical files and are kept for ``tool_cache_offline_ttl_days``,
+so edited data files are picked up again within that time.
+``tool_cache_ttls`` in the config overrides the defaults (seconds, null for
+no expiry, 0 to disable caching of a tool). Results of failed fetches
+(``ToolError``) are never stored. The SQLite tier is kept within
+``tool_cache_max_size_mb`` by evicting the least recently used entries every
+``EVICT_EVERY`` stores.
+"""
+
+import functools
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from langchain_core.tools import BaseTool
+
+from tradingagents.dataflows.config import get_config, get_data_cache_dir
+from tradingagents.dataflows.utils import ToolError
+from tradingagents.i18n import get_locale
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Tools not listed here are offline and use tool_cache_offline_ttl_days
+DEFAULT_TOOL_TTLS: Dict[str, Optional[float]] = {
+    "get_YFin_data_online": 1 * HOUR,
+    "get_stockstats_indicators_report_online": 1 * HOUR,
+    "get_stockstats_indicators_batch_report_online": 1 * HOUR,
+    "get_google_news": 1 * HOUR,
+    "get_stock_news_openai": 6 * HOUR,
+    "get_global_news_openai": 6 * HOUR,
+    "get_fundamentals_openai": 6 * HOUR,
+}
+
+# The size budget is enforced once every this many stores
+EVICT_EVERY = 64
+
+_MISSING = object()
+
+
+class ToolResultCache:
+    """Two tier (LRU memory over SQLite) store of tool results with per-entry expiry."""
+
+    def __init__(
+        self,
+        path: str,
+        memory_entries: int = 1024,
+        max_size_bytes: Optional[int] = None,
+    ):
+        self.path = path
+        self.memory_entries = memory_entries
+        self.max_size_bytes = max_size_bytes or None
+        self._memory: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stores = itertools.count()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tool_results (
+                    key TEXT PRIMARY KEY,
+                    tool TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL,
+                    expires REAL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS tool_results_by_access ON tool_results (accessed)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite connections must not be shared across threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Any:
+        """Return the cached value of key, or _MISSING if absent or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[1] is None or entry[1] > now:
+                    self._memory.move_to_end(key)
+                    return entry[0]
+                del self._memory[key]
+
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT value, expires FROM tool_results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return _MISSING
+        value, expires = json.loads(row[0]), row[1]
+        if expires is not None and expires <= now:
+            with conn:
+                conn.execute("DELETE FROM tool_results WHERE key = ?", (key,))
+            return _MISSING
+
+        with conn:
+            conn.execute("UPDATE tool_results SET accessed = ? WHERE key = ?", (now, key))
+        self._remember(key, value, expires)
+        return value
+
+    def put(self, key: str, tool_name: str, value: Any, ttl: Optional[float]):
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        self._remember(key, value, expires)
+        try:
+            encoded = json.dumps(value, ensure_ascii=False)
+        except TypeError:
+            # Not representable on disk; the memory tier still serves it
+            return
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO tool_results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, tool_name, encoded, len(encoded), now, now, expires),
+            )
+            if next(self._stores) % EVICT_EVERY == 0:
+                self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection):
+        if self.max_size_bytes:
+            # Keep the most recently used entries that fit in the size budget
+            conn.execute(
+                """
+                DELETE FROM tool_results WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, SUM(size) OVER (
+                            ORDER BY accessed DESC, key
+                        ) AS running FROM tool_results
+                    ) WHERE running > ?
+                )
+                """,
+                (self.max_size_bytes,),
+            )
+
+    def _remember(self, key: str, value: Any, expires: Optional[float]):
+        with self._lock:
+            self._memory[key] = (value, expires)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def clear(self, tool_name: Optional[str] = None):
+        with self._lock:
+            self._memory.clear()
+        with self._connect() as conn:
+            if tool_name is None:
+                conn.execute("DELETE FROM tool_results")
+            else:
+                conn.execute("DELETE FROM tool_results WHERE tool = ?", (tool_name,))
+
+    def purge_expired(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM tool_results WHERE expires <= ?", (time.time(),))
+
+
+_caches: Dict[str, ToolResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_tool_cache() -> Optional[ToolResultCache]:
+    """Return the shared tool result cache, or None if it is disabled in the config."""
+    config = get_config()
+    if not config.get("tool_cache", True):
+        return None
+
+    path = os.path.abspath(os.path.join(get_data_cache_dir(), "tool_cache.sqlite"))
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            max_size_mb = config.get("tool_cache_max_size_mb", 256)
+            try:
+                cache = ToolResultCache(
+                    path,
+                    config.get("tool_cache_memory_entries", 1024),
+                    max_size_bytes=int(max_size_mb * 1024 * 1024) if max_size_mb else None,
+                )
+            except sqlite3.Error:
+                return None
+            _caches[path] = cache
+    return cache
+
+
+def tool_ttl(tool_name: str) -> Optional[float]:
+    """Return how long a result of the tool stays valid, None meaning forever."""
+    config = get_config()
+    overrides = config.get("tool_cache_ttls") or {}
+    if tool_name in overrides:
+        return overrides[tool_name]
+    if tool_name in DEFAULT_TOOL_TTLS:
+        return DEFAULT_TOOL_TTLS[tool_name]
+    offline_days = config.get("tool_cache_offline_ttl_days", 7)
+    return offline_days * DAY if offline_days else None
+
+
+def _cache_key(tool_name: str, args: tuple, kwargs: dict) -> str:
+    config = get_config()
+    data_dir = config.get("data_dir") or config["project_settings"]["data_dir"]
+    payload = json.dumps(
+        # Tools format their reports in the active language
+        [os.path.abspath(data_dir), get_locale(), tool_name, list(args), kwargs],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _lookup(tool_name: str, args: tuple, kwargs: dict):
+    ttl = tool_ttl(tool_name)
+    cache = get_tool_cache() if ttl != 0 else None
+    if cache is None:
+        return None, None, _MISSING, ttl
+    key = _cache_key(tool_name, args, kwargs)
+    return cache, key, cache.get(key), ttl
+
+
+def memoize_tool(tool: BaseTool) -> BaseTool:
+    """Wrap the sync and async functions of a tool with the result cache, in place."""
+    tool_name = tool.name
+
+    if getattr(tool, "func", None) is not None:
+        func = tool.func
+
+        @functools.wraps(func)
+        def cached_func(*args, **kwargs):
+            cache, key, value, ttl = _lookup(tool_name, args, kwargs)
+            if value is not _MISSING:
+                return value
+            value = func(*args, **kwargs)
+            if cache is not None and not isinstance(value, ToolError):
+                cache.put(key, tool_name, value, ttl)
+            return value
+
+        tool.func = cached_func
+
+    if getattr(tool, "coroutine", None) is not None:
+        coroutine = tool.coroutine
+
+        @functools.wraps(coroutine)
+        async def cached_coroutine(*args, **kwargs):
+            cache, key, value, ttl = _lookup(tool_name, args, kwargs)
+            if value is not _MISSING:
+                return value
+            value = await coroutine(*args, **kwargs)
+            if cache is not None and not isinstance(value, ToolError):
+                cache.put(key, tool_name, value, ttl)
+            return value
+
+        tool.coroutine = cached_coroutine
+
+    return tool
+
+
+def memoize_toolkit(toolkit_class) -> None:
+    """Memoize every tool defined on a Toolkit class."""
+    for name, value in list(vars(toolkit_class).items()):
+        tool = value.__func__ if isinstance(value, staticmethod) else value
+        if isinstance(tool, BaseTool):
+            memoize_tool(tool)
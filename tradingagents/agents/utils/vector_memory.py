@@ -0,0 +1,196 @@
+"""
+NumPy vector index backend for agent memories.
+
+An agent holds at most a few thousand lessons, so an exact search over a
+contiguous float32 matrix of L2-normalized embeddings (one matrix-vector
+product per query) is both faster and lighter than a Chroma client.
+
+Persistent memories live in three files per collection under the memory
+directory: the raw ``.f32`` matrix, opened with ``np.memmap``, a ``.jsonl`` file
+with one record per row and a ``.json`` header with the dimension, the row
+count and the size of the records file. Writers append to both files under the
+collection's writer lock and publish the new header last, so readers in other
+processes only ever see complete rows and pick up new ones on their next
+access. ``create_memory`` uses this class for every persistent memory,
+whichever backend is configured.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from tradingagents.embedding import EmbeddingManager
+
+from .memory import memory_dir, memory_setting, situation_id, writer_lock
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+class NumpySituationMemory:
+    """Drop-in alternative to FinancialSituationMemory backed by a float32 matrix."""
+
+    def __init__(self, name, config):
+        self.embedding_manager = EmbeddingManager(config)
+
+        # Vectors of different embedding models must not share a collection
+        collection_name = f"{name}-{self.embedding_manager.model_digest()}"
+        self._vectors = np.zeros((0, 0), dtype=np.float32)
+        self._records: List[Dict[str, str]] = []
+        self._ids = set()
+        self._header = None
+
+        if memory_setting(config, "persistent", True):
+            path = memory_dir(config)
+            os.makedirs(path, exist_ok=True)
+            base = os.path.join(path, collection_name)
+            self._matrix_path = f"{base}.f32"
+            self._records_path = f"{base}.jsonl"
+            self._header_path = f"{base}.json"
+            self._lock_path = f"{base}.lock"
+        else:
+            self._header_path = None
+
+    def get_embedding(self, text, strict=False):
+        """Get embedding for a text using configured provider"""
+        return self.embedding_manager.get_embedding(text, strict=strict)
+
+    def count(self) -> int:
+        self._refresh()
+        return len(self._records)
+
+    def _read_header(self) -> Optional[Dict[str, int]]:
+        try:
+            with open(self._header_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _refresh(self):
+        """Pick up rows published by other processes since the last load."""
+        if self._header_path is None:
+            return
+        header = self._read_header()
+        if header is None or header == self._header:
+            return
+
+        count, dim = header["count"], header["dim"]
+        vectors = (
+            np.memmap(self._matrix_path, dtype=np.float32, mode="r", shape=(count, dim))
+            if count
+            else np.zeros((0, dim), dtype=np.float32)
+        )
+        with open(self._records_path, "rb") as f:
+            data = f.read(header["records_bytes"])
+        self._records = [json.loads(line) for line in data.splitlines()]
+        self._vectors = vectors
+        self._ids = {record["id"] for record in self._records}
+        self._header = header
+
+    def add_situations(self, situations_and_advice, embeddings=None):
+        """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)
+
+        embeddings may hold precomputed embeddings of the situations, in order;
+        otherwise all situations are embedded with batched requests. Situations
+        already stored with the same advice are skipped without re-embedding.
+        Lessons are never stored with mock fallback vectors: if the provider
+        fails, EmbeddingError is raised and nothing is added.
+        """
+        entries = {}
+        for i, (situation, recommendation) in enumerate(situations_and_advice):
+            entries.setdefault(situation_id(situation, recommendation), i)
+        if not entries:
+            return
+
+        if self._header_path is None:
+            self._append(entries, situations_and_advice, embeddings)
+        else:
+            with writer_lock(self._lock_path):
+                self._refresh()
+                self._append(entries, situations_and_advice, embeddings)
+
+    def _append(self, entries, situations_and_advice, embeddings):
+        new = [(key, i) for key, i in entries.items() if key not in self._ids]
+        if not new:
+            return
+
+        situations = [situations_and_advice[i][0] for _key, i in new]
+        if embeddings is None:
+            vectors = self.embedding_manager.get_batch_embeddings(situations, strict=True)
+        else:
+            vectors = [embeddings[i] for _key, i in new]
+        vectors = _normalize(np.asarray(vectors, dtype=np.float32))
+        records = [
+            {
+                "id": key,
+                "situation": situations_and_advice[i][0],
+                "recommendation": situations_and_advice[i][1],
+            }
+            for key, i in new
+        ]
+
+        count = len(self._records)
+        if count and vectors.shape[1] != self._vectors.shape[1]:
+            raise ValueError(
+                f"Embedding dimension {vectors.shape[1]} does not match the stored {self._vectors.shape[1]}"
+            )
+
+        if self._header_path is None:
+            self._vectors = np.concatenate([self._vectors, vectors]) if count else vectors
+            self._records.extend(records)
+            self._ids.update(record["id"] for record in records)
+            return
+
+        # Cut both files to the published size first: a writer that crashed
+        # before publishing may have left a partial tail
+        records_bytes = self._header["records_bytes"] if self._header else 0
+        with open(self._matrix_path, "ab") as f:
+            f.truncate(count * vectors.shape[1] * 4)
+            f.write(np.ascontiguousarray(vectors).tobytes())
+        with open(self._records_path, "ab") as f:
+            f.truncate(records_bytes)
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+            records_bytes = f.tell()
+
+        header = {
+            "count": count + len(records),
+            "dim": int(vectors.shape[1]),
+            "records_bytes": records_bytes,
+        }
+        tmp_path = f"{self._header_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(header, f)
+        os.replace(tmp_path, self._header_path)
+        self._refresh()
+
+    def get_memories(self, current_situation, n_matches=1, query_embedding=None):
+        """Find matching recommendations using configured embeddings
+
+        query_embedding may hold the precomputed embedding of current_situation.
+        """
+        self._refresh()
+        if not self._records:
+            return []
+
+        if query_embedding is None:
+            query_embedding = self.get_embedding(current_situation)
+        query = _normalize(np.asarray(query_embedding, dtype=np.float32))
+        scores = self._vectors @ query
+
+        k = min(n_matches, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        return [
+            {
+                "matched_situation": self._records[i]["situation"],
+                "recommendation": self._records[i]["recommendation"],
+                "similarity_score": float(scores[i]),
+            }
+            for i in top
+        ]
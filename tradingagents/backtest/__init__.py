@@ -0,0 +1,9 @@
+# TradingAgents/backtest/__init__.py
+
+from .runner import BacktestRunner, parse_decision, reflection_state
+
+__all__ = [
+    "BacktestRunner",
+    "parse_decision",
+    "reflection_state",
+]
@@ -0,0 +1,262 @@
+"""
+Backtest runner for TradingAgentsGraph.
+
+Sweeps one ticker over the trading days of a date range, taken from the
+offline ``market_data/price_data`` files, and scores every decision with the
+realized close-to-close return over ``holding_days`` trading days. With
+reflection enabled the dates run in order and each decision is fed back to
+``reflect_and_remember`` as soon as its return would have been known, i.e.
+before the first trade date on or after the end of its holding period, so
+later decisions never learn from the future. Without reflection the dates are
+independent and run concurrently through ``propagate_batch``.
+
+Progress is checkpointed to ``{results_dir}/backtests`` after every date, so
+an interrupted run picks up where it stopped when started again:
+
+    runner = BacktestRunner(TradingAgentsGraph(config=config))
+    records = runner.run("NVDA", "2024-01-02", "2024-03-28")
+    print(runner.summarize(records))
+"""
+
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+from tradingagents.dataflows.price_store import get_price_store
+from tradingagents.embedding import EmbeddingError
+
+DECISION_SIGNS = {"BUY": 1, "SELL": -1, "HOLD": 0}
+
+_DECISION_PATTERN = re.compile(r"\b(BUY|SELL|HOLD)\b")
+
+
+def parse_decision(signal: str) -> Optional[str]:
+    """Return BUY, SELL or HOLD from a processed signal, or None if there is none."""
+    match = _DECISION_PATTERN.search((signal or "").upper())
+    return match.group(1) if match else None
+
+
+def reflection_state(final_state: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep the parts of a final state the Reflector reads, in a JSON friendly form."""
+    return {
+        "market_report": final_state["market_report"],
+        "sentiment_report": final_state["sentiment_report"],
+        "news_report": final_state["news_report"],
+        "fundamentals_report": final_state["fundamentals_report"],
+        "investment_debate_state": {
+            "bull_history": final_state["investment_debate_state"]["bull_history"],
+            "bear_history": final_state["investment_debate_state"]["bear_history"],
+            "judge_decision": final_state["investment_debate_state"]["judge_decision"],
+        },
+        "trader_investment_plan": final_state["trader_investment_plan"],
+        "risk_debate_state": {
+            "judge_decision": final_state["risk_debate_state"]["judge_decision"],
+        },
+    }
+
+
+class BacktestRunner:
+    """Runs a TradingAgentsGraph over a range of trading days and scores each decision."""
+
+    def __init__(
+        self,
+        graph,
+        holding_days: int = 1,
+        checkpoint_dir: Optional[str] = None,
+        price_dir: Optional[str] = None,
+    ):
+        if holding_days < 1:
+            raise ValueError("holding_days must be at least 1")
+
+        config = graph.config
+        project_settings = config.get("project_settings", {})
+        data_dir = config.get("data_dir") or project_settings.get("data_dir", "./data")
+        results_dir = config.get("results_dir") or project_settings.get(
+            "results_dir", "./results"
+        )
+
+        self.graph = graph
+        self.holding_days = holding_days
+        self.checkpoint_dir = checkpoint_dir or os.path.join(results_dir, "backtests")
+        self.prices = get_price_store(
+            price_dir or os.path.join(data_dir, "market_data", "price_data")
+        )
+
+    def trading_days(self, ticker: str, start_date: str, end_date: str) -> List[str]:
+        """Return the dates with a price bar for ticker within [start_date, end_date]."""
+        series = self.prices.load(ticker)
+        lo, hi = series.locate(start_date, end_date)
+        return [str(day) for day in series.date_strings(lo, hi)]
+
+    def realized_return(self, ticker: str, trade_date: str) -> Optional[float]:
+        """Close-to-close return from trade_date over the holding period.
+
+        None if trade_date is not a trading day or the holding period ends after
+        the last bar in the price data.
+        """
+        series = self.prices.load(ticker)
+        row = series.index_of(trade_date)
+        if row is None or row + self.holding_days >= len(series):
+            return None
+
+        closes = series.column("Close")
+        entry, exit_ = float(closes[row]), float(closes[row + self.holding_days])
+        return exit_ / entry - 1.0
+
+    def checkpoint_path(self, ticker: str, start_date: str, end_date: str) -> str:
+        return os.path.join(
+            self.checkpoint_dir,
+            f"{ticker}_{start_date}_{end_date}_h{self.holding_days}.json",
+        )
+
+    def run(
+        self,
+        ticker: str,
+        start_date: str,
+        end_date: str,
+        reflect: bool = True,
+        max_concurrency: int = 4,
+    ) -> List[Dict[str, Any]]:
+        """Backtest ticker over the trading days in [start_date, end_date].
+
+        Dates already recorded in the checkpoint are skipped. With reflect the
+        dates run one after another and max_concurrency is ignored, since each
+        decision may depend on the memories written for the earlier ones.
+
+        Returns:
+            One record per trading day, in date order, with the processed signal,
+            the parsed decision, the market return over the holding period and
+            the return of the position taken (None while not yet realized).
+        """
+        days = self.trading_days(ticker, start_date, end_date)
+        path = self.checkpoint_path(ticker, start_date, end_date)
+        checkpoint = self._load_checkpoint(path) or {
+            "ticker": ticker,
+            "start_date": start_date,
+            "end_date": end_date,
+            "holding_days": self.holding_days,
+            "records": {},
+            "pending_reflections": {},
+        }
+
+        todo = [day for day in days if day not in checkpoint["records"]]
+        if reflect:
+            self._run_sequential(ticker, days, todo, checkpoint, path)
+        elif todo:
+            self._run_parallel(ticker, todo, checkpoint, path, max_concurrency)
+
+        return [checkpoint["records"][day] for day in days if day in checkpoint["records"]]
+
+    def _run_sequential(self, ticker, days, todo, checkpoint, path):
+        position = {day: i for i, day in enumerate(days)}
+        pending = checkpoint["pending_reflections"]
+
+        for trade_date in todo:
+            # Learn only from the decisions whose holding period has ended by now
+            self._reflect_due(
+                checkpoint,
+                path,
+                lambda day: position.get(day, -1) + self.holding_days <= position[trade_date],
+            )
+
+            final_state, signal = self.graph.propagate(ticker, trade_date)
+            checkpoint["records"][trade_date] = self._record(ticker, trade_date, signal)
+            pending[trade_date] = reflection_state(final_state)
+            self._save_checkpoint(path, checkpoint)
+
+        # Whatever has a realized return by the end of the data can be reflected on now
+        self._reflect_due(checkpoint, path, lambda day: True)
+
+    def _reflect_due(self, checkpoint, path, is_due):
+        pending = checkpoint["pending_reflections"]
+        for trade_date in sorted(pending):
+            record = checkpoint["records"].get(trade_date)
+            if record is None or record["position_return"] is None or not is_due(trade_date):
+                continue
+            try:
+                self.graph.reflect_and_remember(record["position_return"], pending[trade_date])
+            except EmbeddingError:
+                # Stays pending: retried on the next pass, or by a later run
+                continue
+            record["reflected"] = True
+            del pending[trade_date]
+            self._save_checkpoint(path, checkpoint)
+
+    def _run_parallel(self, ticker, todo, checkpoint, path, max_concurrency):
+        errors = []
+        for result in self.graph.propagate_batch(ticker, todo, max_concurrency):
+            if result.error is not None:
+                # Left out of the checkpoint so a later run retries the date
+                errors.append(result)
+                continue
+            checkpoint["records"][result.trade_date] = self._record(
+                ticker, result.trade_date, result.decision
+            )
+            self._save_checkpoint(path, checkpoint)
+
+        if errors:
+            first = errors[0]
+            raise RuntimeError(
+                f"{len(errors)} of {len(todo)} backtest dates failed, "
+                f"first: {first.ticker} {first.trade_date}"
+            ) from first.error
+
+    def _record(self, ticker: str, trade_date: str, signal: str) -> Dict[str, Any]:
+        decision = parse_decision(signal)
+        market_return = self.realized_return(ticker, trade_date)
+        position_return = None
+        if market_return is not None:
+            position_return = DECISION_SIGNS.get(decision, 0) * market_return
+        return {
+            "trade_date": trade_date,
+            "signal": signal,
+            "decision": decision,
+            "return": market_return,
+            "position_return": position_return,
+            "reflected": False,
+        }
+
+    @staticmethod
+    def _load_checkpoint(path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _save_checkpoint(path: str, checkpoint: Dict[str, Any]):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def summarize(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Aggregate the realized position returns of a backtest.
+
+        The cumulative return compounds the daily position returns, which is
+        only a portfolio return when holding periods do not overlap
+        (holding_days == 1).
+        """
+        realized = [r for r in records if r["position_return"] is not None]
+        trades = [r for r in realized if DECISION_SIGNS.get(r["decision"], 0) != 0]
+
+        cumulative = 1.0
+        for record in realized:
+            cumulative *= 1.0 + record["position_return"]
+
+        return {
+            "days": len(records),
+            "realized_days": len(realized),
+            "trades": len(trades),
+            "hit_rate": (
+                sum(r["position_return"] > 0 for r in trades) / len(trades) if trades else None
+            ),
+            "cumulative_return": cumulative - 1.0,
+            "decisions": {
+                name: sum(r["decision"] == name for r in records) for name in DECISION_SIGNS
+            },
+        }
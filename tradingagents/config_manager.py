@@ -17,6 +17,10 @@ except ImportError:
         return key.format(**kwargs) if kwargs else key
 
 
+# Whether the analyst team runs concurrently when a config does not say
+PARALLEL_ANALYSTS_DEFAULT = True
+
+
 class ConfigManager:
     """Manages configuration loading and access for TradingAgents."""
     
@@ -96,16 +100,40 @@ class ConfigManager:
             "debate_settings": {
                 "max_debate_rounds": 1,
                 "max_risk_discuss_rounds": 1,
-                "max_recur_limit": 100
+                "max_recur_limit": 100,
+                "parallel_analysts": PARALLEL_ANALYSTS_DEFAULT
             },
             "tool_settings": {
-                "online_tools": True
+                "online_tools": True,
+                "indicator_cache": True,
+                "online_price_source": "yfinance"
+            },
+            "cache_settings": {
+                "llm_cache_mode": "off",
+                "llm_cache_ttl_days": 30,
+                "llm_cache_max_size_mb": 512,
+                "tool_cache": True,
+                "tool_cache_memory_entries": 1024,
+                "tool_cache_max_size_mb": 256,
+                "tool_cache_offline_ttl_days": 7,
+                "tool_cache_ttls": {}
+            },
+            "memory_settings": {
+                "backend": "chroma",
+                "persistent": True,
+                "dir": ""
             },
             "embedding_settings": {
                 "enabled": True,
                 "provider": "auto",
                 "fallback_to_mock": True,
-                "embedding_dim": 1536
+                "embedding_dim": 1536,
+                "batch_size": None,
+                "max_concurrency": 4,
+                "max_retries": 5,
+                "cache": True,
+                "cache_memory_entries": 4096,
+                "cache_dtype": "float32"
             },
             "language": "zh-CN"
         }
@@ -168,6 +196,14 @@ class ConfigManager:
         """Get a tool setting value."""
         return self._config.get("tool_settings", {}).get(key, default)
     
+    def get_cache_setting(self, key: str, default: Any = None) -> Any:
+        """Get a cache setting value."""
+        return self._config.get("cache_settings", {}).get(key, default)
+    
+    def get_memory_setting(self, key: str, default: Any = None) -> Any:
+        """Get a memory setting value."""
+        return self._config.get("memory_settings", {}).get(key, default)
+    
     def get_embedding_setting(self, key: str, default: Any = None) -> Any:
         """Get an embedding setting value."""
         return self._config.get("embedding_settings", {}).get(key, default)
@@ -244,7 +280,21 @@ def get_default_config_dict() -> Dict[str, Any]:
         "max_debate_rounds": config.get_debate_setting("max_debate_rounds"),
         "max_risk_discuss_rounds": config.get_debate_setting("max_risk_discuss_rounds"),
         "max_recur_limit": config.get_debate_setting("max_recur_limit"),
+        "parallel_analysts": config.get_debate_setting("parallel_analysts", PARALLEL_ANALYSTS_DEFAULT),
         "online_tools": config.get_tool_setting("online_tools"),
+        "indicator_cache": config.get_tool_setting("indicator_cache", True),
+        "online_price_source": config.get_tool_setting("online_price_source", "yfinance"),
+        "llm_cache_mode": config.get_cache_setting("llm_cache_mode", "off"),
+        "llm_cache_ttl_days": config.get_cache_setting("llm_cache_ttl_days", 30),
+        "llm_cache_max_size_mb": config.get_cache_setting("llm_cache_max_size_mb", 512),
+        "tool_cache": config.get_cache_setting("tool_cache", True),
+        "tool_cache_memory_entries": config.get_cache_setting("tool_cache_memory_entries", 1024),
+        "tool_cache_max_size_mb": config.get_cache_setting("tool_cache_max_size_mb", 256),
+        "tool_cache_offline_ttl_days": config.get_cache_setting("tool_cache_offline_ttl_days", 7),
+        "tool_cache_ttls": config.get_cache_setting("tool_cache_ttls", {}),
+        "memory_backend": config.get_memory_setting("backend", "chroma"),
+        "memory_persistent": config.get_memory_setting("persistent", True),
+        "memory_dir": config.get_memory_setting("dir", ""),
         "api_keys": {
             provider: config.get_api_key(provider)
             for provider in config.get_available_providers().keys()
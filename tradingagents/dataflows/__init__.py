@@ -1,8 +1,14 @@
-from .finnhub_utils import get_data_in_range
+from .finnhub_utils import get_data_in_range, get_finnhub_index, FinnhubIndex
 from .googlenews_utils import getNewsData
 from .yfin_utils import YFinanceUtils
 from .reddit_utils import fetch_top_from_category
 from .stockstats_utils import StockstatsUtils
+from .price_store import PriceStore, get_price_store
+from .indicators import compute_indicators
+from .indicator_cache import IndicatorCache, get_indicator_cache
+from .online_price_cache import OnlinePriceCache, LocalPriceDownloader, get_online_price_cache
+from .fundamentals_store import FundamentalsStore, get_fundamentals_store
+from .reddit_index import RedditIndex, build_reddit_index, get_reddit_index
 from .yfin_utils import YFinanceUtils
 
 from .interface import (
@@ -14,11 +20,14 @@ from .interface import (
     get_reddit_global_news,
     get_reddit_company_news,
     # Financial statements functions
+    get_simfin_fundamentals_snapshot,
+    get_simfin_fundamentals,
     get_simfin_balance_sheet,
     get_simfin_cashflow,
     get_simfin_income_statements,
     # Technical analysis functions
     get_stock_stats_indicators_window,
+    get_stock_stats_indicators_batch,
     get_stockstats_indicator,
     # Market data functions
     get_YFin_data_window,
@@ -34,11 +43,14 @@ __all__ = [
     "get_reddit_global_news",
     "get_reddit_company_news",
     # Financial statements functions
+    "get_simfin_fundamentals_snapshot",
+    "get_simfin_fundamentals",
     "get_simfin_balance_sheet",
     "get_simfin_cashflow",
     "get_simfin_income_statements",
     # Technical analysis functions
     "get_stock_stats_indicators_window",
+    "get_stock_stats_indicators_batch",
     "get_stockstats_indicator",
     # Market data functions
     "get_YFin_data_window",
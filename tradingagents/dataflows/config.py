@@ -31,5 +31,17 @@ def get_config() -> Dict:
     return _config.copy()
 
 
+def get_data_cache_dir(config: Optional[Dict] = None) -> str:
+    """Get the dataflow cache directory from either the flat or the nested config.
+
+    Reads the given config, or the current dataflow config if there is none.
+    """
+    if config is None:
+        config = get_config()
+    return config.get("data_cache_dir") or config.get("project_settings", {}).get(
+        "data_cache_dir", "./tradingagents/dataflows/data_cache"
+    )
+
+
 # Initialize with default config
 initialize_config()
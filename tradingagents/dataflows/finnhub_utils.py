@@ -1,5 +1,81 @@
+import bisect
 import json
 import os
+import threading
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from .utils import file_signature
+
+
+class FinnhubIndex:
+    """
+    Date-sorted index over one ``*_data_formatted.json`` file.
+    Dates with no records are dropped, the remaining ones are kept sorted so a
+    date range is resolved with two binary searches.
+    """
+
+    def __init__(self, data: Dict[str, list]):
+        entries = [
+            (key, position, value)
+            for position, (key, value) in enumerate(data.items())
+            if len(value) > 0
+        ]
+        entries.sort(key=lambda entry: entry[0])
+        self.dates: List[str] = [entry[0] for entry in entries]
+        self._positions: List[int] = [entry[1] for entry in entries]
+        self._values: List[list] = [entry[2] for entry in entries]
+
+    @classmethod
+    def from_file(cls, path: str) -> "FinnhubIndex":
+        with open(path, "r") as f:
+            return cls(json.load(f))
+
+    def range(self, start_date: str, end_date: str) -> Dict[str, list]:
+        """Return the records dated within [start_date, end_date], in file order."""
+        lo = bisect.bisect_left(self.dates, start_date)
+        hi = bisect.bisect_right(self.dates, end_date)
+        rows = sorted(range(lo, hi), key=self._positions.__getitem__)
+        return {self.dates[i]: self._values[i] for i in rows}
+
+
+_indexes: Dict[str, Tuple[Dict, FinnhubIndex]] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_finnhub_index(path: str) -> FinnhubIndex:
+    """Return the index of a finnhub data file, rebuilding it only when the file changes."""
+    signature = file_signature(path)
+
+    cached = _indexes.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with _indexes_lock:
+        cached = _indexes.get(path)
+        if cached is None or cached[0] != signature:
+            cached = (signature, FinnhubIndex.from_file(path))
+            _indexes[path] = cached
+    return cached[1]
+
+
+def _record_key(value):
+    # Hashable form of a JSON record that compares equal exactly when the records do
+    if isinstance(value, dict):
+        return tuple(sorted((key, _record_key(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_record_key(item) for item in value)
+    return value
+
+
+def unique_records(data: Dict[str, Iterable[dict]]) -> Iterator[dict]:
+    """Yield every record of a date -> records mapping once, keeping the first occurrence."""
+    seen = set()
+    for records in data.values():
+        for entry in records:
+            key = _record_key(entry)
+            if key not in seen:
+                seen.add(key)
+                yield entry
 
 
 def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=None):
@@ -25,12 +101,5 @@ def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=
             data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
         )
 
-    data = open(data_path, "r")
-    data = json.load(data)
-
     # filter keys (date, str in format YYYY-MM-DD) by the date range (str, str in format YYYY-MM-DD)
-    filtered_data = {}
-    for key, value in data.items():
-        if start_date <= key <= end_date and len(value) > 0:
-            filtered_data[key] = value
-    return filtered_data
+    return get_finnhub_index(data_path).range(start_date, end_date)
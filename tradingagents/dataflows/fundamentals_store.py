@@ -0,0 +1,195 @@
+"""
+Indexed store for the SimFin fundamental statement files.
+
+The US-wide SimFin CSVs cover thousands of companies. Each statement file is
+parsed once, its date columns normalized, and the rows sorted by
+(Ticker, Publish Date). The sorted table is persisted in the dataflow cache
+directory together with the source file signature, so later processes skip
+the CSV parse entirely. A point-in-time lookup ("latest report published on
+or before D") is a dictionary lookup of the ticker's row range followed by a
+binary search over its publish dates.
+"""
+
+import os
+import pickle
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import get_data_cache_dir
+from .utils import file_signature
+
+STATEMENT_FILES = {
+    "balance_sheet": ("balance_sheet", "us-balance-{freq}.csv"),
+    "cashflow": ("cash_flow", "us-cashflow-{freq}.csv"),
+    "income_statement": ("income_statements", "us-income-{freq}.csv"),
+}
+
+_FORMAT_VERSION = 1
+
+
+class StatementTable:
+    """One statement file sorted by (Ticker, Publish Date) with per-ticker row ranges."""
+
+    def __init__(self, frame: pd.DataFrame, ranges: Dict[str, Tuple[int, int]]):
+        self.frame = frame
+        self.ranges = ranges
+        # UTC publish dates as naive datetime64, NaT sorts last within a ticker
+        self.publish_dates = frame["Publish Date"].dt.tz_convert(None).to_numpy()
+
+    @classmethod
+    def from_csv(cls, path: str) -> "StatementTable":
+        df = pd.read_csv(path, sep=";")
+
+        # Convert date strings to datetime objects and remove any time components
+        df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+        df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+
+        # Stable sort keeps rows with equal keys in file order, like the original scan
+        df = df.sort_values(["Ticker", "Publish Date"], kind="mergesort")
+
+        tickers = df["Ticker"].to_numpy()
+        ranges: Dict[str, Tuple[int, int]] = {}
+        start = 0
+        for pos in range(1, len(tickers) + 1):
+            if pos == len(tickers) or tickers[pos] != tickers[start]:
+                if isinstance(tickers[start], str):
+                    ranges[tickers[start]] = (start, pos)
+                start = pos
+        return cls(df, ranges)
+
+    def latest(self, ticker: str, curr_date) -> Optional[pd.Series]:
+        """Return the most recent row of a ticker published on or before curr_date."""
+        bounds = self.ranges.get(ticker)
+        if bounds is None:
+            return None
+
+        lo, hi = bounds
+        day = pd.to_datetime(curr_date, utc=True).normalize().tz_convert(None).to_datetime64()
+        dates = self.publish_dates[lo:hi]
+        end = int(np.searchsorted(dates, day, side="right"))
+        if end == 0:
+            return None
+
+        # Several reports may share the publish date; the first in file order wins
+        first = int(np.searchsorted(dates, dates[end - 1], side="left"))
+        return self.frame.iloc[lo + first]
+
+
+class FundamentalsStore:
+    """Loads each SimFin statement file once and keeps a sorted copy on disk."""
+
+    def __init__(self, data_dir: str, cache_dir: Optional[str] = None):
+        self.data_dir = data_dir
+        self.cache_dir = cache_dir or os.path.join(get_data_cache_dir(), "fundamentals")
+        self._tables: Dict[Tuple[str, str], StatementTable] = {}
+        self._lock = threading.Lock()
+
+    def source_path(self, statement: str, freq: str) -> str:
+        folder, file_name = STATEMENT_FILES[statement]
+        return os.path.join(
+            self.data_dir,
+            "fundamental_data",
+            "simfin_data_all",
+            folder,
+            "companies",
+            "us",
+            file_name.format(freq=freq),
+        )
+
+    def table(self, statement: str, freq: str) -> StatementTable:
+        """Return the indexed table of a statement, parsing the CSV only if needed."""
+        key = (statement, freq)
+        table = self._tables.get(key)
+        if table is not None:
+            return table
+
+        with self._lock:
+            table = self._tables.get(key)
+            if table is None:
+                source = self.source_path(statement, freq)
+                signature = file_signature(source)
+                table = self._read_cached(statement, freq, signature)
+                if table is None:
+                    table = StatementTable.from_csv(source)
+                    self._write_cached(statement, freq, signature, table)
+                self._tables[key] = table
+        return table
+
+    def latest(
+        self, statement: str, ticker: str, freq: str, curr_date
+    ) -> Optional[pd.Series]:
+        return self.table(statement, freq).latest(ticker, curr_date)
+
+    def snapshot(
+        self,
+        ticker: str,
+        freq: str,
+        curr_date,
+        statements: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Optional[pd.Series]]:
+        """Return the latest report of each statement published on or before curr_date."""
+        statements = STATEMENT_FILES if statements is None else statements
+        return {
+            statement: self.latest(statement, ticker, freq, curr_date)
+            for statement in statements
+        }
+
+    def invalidate(self):
+        with self._lock:
+            self._tables.clear()
+
+    def _cache_path(self, statement: str, freq: str) -> str:
+        return os.path.join(self.cache_dir, f"{statement}-{freq}.pkl")
+
+    def _read_cached(
+        self, statement: str, freq: str, signature: Dict
+    ) -> Optional[StatementTable]:
+        try:
+            with open(self._cache_path(statement, freq), "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("format") != _FORMAT_VERSION or cached.get("source") != signature:
+                return None
+            return StatementTable(cached["frame"], cached["ranges"])
+        except Exception:
+            # A missing, stale or unreadable copy just means parsing the CSV again
+            return None
+
+    def _write_cached(
+        self, statement: str, freq: str, signature: Dict, table: StatementTable
+    ):
+        path = self._cache_path(statement, freq)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(
+                    {
+                        "format": _FORMAT_VERSION,
+                        "source": signature,
+                        "frame": table.frame,
+                        "ranges": table.ranges,
+                    },
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+_stores: Dict[str, FundamentalsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_fundamentals_store(data_dir: str) -> FundamentalsStore:
+    """Return the shared fundamentals store for a data directory."""
+    key = os.path.abspath(data_dir)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = FundamentalsStore(data_dir)
+            _stores[key] = store
+    return store
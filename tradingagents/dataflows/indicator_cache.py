@@ -0,0 +1,119 @@
+"""
+Persistent cache of computed indicator columns.
+
+Indicator values over a fixed price history never change, so each computed
+column is stored in a SQLite database under ``data_cache_dir`` keyed by
+symbol, indicator name and the content hash of the source price data. Any
+process that sees the same price file reuses the stored column instead of
+recomputing it; a new version of the file simply replaces the old rows.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from .config import get_config, get_data_cache_dir
+
+
+class IndicatorCache:
+    """SQLite backed store of float64 indicator columns."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS indicators (
+                    symbol TEXT NOT NULL,
+                    indicator TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    length INTEGER NOT NULL,
+                    data BLOB NOT NULL,
+                    created REAL NOT NULL,
+                    PRIMARY KEY (symbol, indicator, version)
+                )
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite connections must not be shared across threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get_many(
+        self, symbol: str, indicators: Iterable[str], version: str, length: int
+    ) -> Dict[str, np.ndarray]:
+        """Return the cached columns among ``indicators`` for this data version."""
+        names = list(indicators)
+        if not names:
+            return {}
+
+        placeholders = ",".join("?" * len(names))
+        rows = self._connect().execute(
+            f"SELECT indicator, length, data FROM indicators "
+            f"WHERE symbol = ? AND version = ? AND indicator IN ({placeholders})",
+            [symbol, version, *names],
+        ).fetchall()
+
+        return {
+            name: np.frombuffer(data, dtype=np.float64)
+            for name, stored_length, data in rows
+            if stored_length == length
+        }
+
+    def put_many(self, symbol: str, version: str, columns: Dict[str, np.ndarray]):
+        """Store computed columns, dropping rows of older data versions."""
+        if not columns:
+            return
+
+        now = time.time()
+        with self._connect() as conn:
+            for name, values in columns.items():
+                values = np.ascontiguousarray(values, dtype=np.float64)
+                conn.execute(
+                    "DELETE FROM indicators WHERE symbol = ? AND indicator = ? AND version != ?",
+                    (symbol, name, version),
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO indicators VALUES (?, ?, ?, ?, ?, ?)",
+                    (symbol, name, version, len(values), values.tobytes(), now),
+                )
+
+    def clear(self, symbol: Optional[str] = None):
+        with self._connect() as conn:
+            if symbol is None:
+                conn.execute("DELETE FROM indicators")
+            else:
+                conn.execute("DELETE FROM indicators WHERE symbol = ?", (symbol,))
+
+
+_caches: Dict[str, IndicatorCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_indicator_cache() -> Optional[IndicatorCache]:
+    """Return the shared indicator cache, or None if it is disabled in the config."""
+    if not get_config().get("indicator_cache", True):
+        return None
+
+    path = os.path.abspath(os.path.join(get_data_cache_dir(), "indicator_cache.sqlite"))
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            try:
+                cache = IndicatorCache(path)
+            except sqlite3.Error:
+                return None
+            _caches[path] = cache
+    return cache
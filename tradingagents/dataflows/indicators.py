@@ -0,0 +1,258 @@
+"""
+Vectorized technical indicator engine.
+
+Computes each requested indicator once over the whole price history with
+NumPy/pandas kernels, so a look-back window is a single slice instead of one
+full recomputation per day. The kernels follow the stockstats definitions
+(window defaults, smoothing and warm-up values) so results match
+``stockstats.wrap(df)[indicator]``; names the engine does not know are
+delegated to stockstats in one batch. Computed columns are persisted in the
+indicator cache so other runs over the same data skip the computation.
+"""
+
+import re
+import sqlite3
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from stockstats import wrap
+
+from .price_store import PriceSeries
+from .indicator_cache import get_indicator_cache
+
+BOLL_STD_TIMES = 2
+
+_MOVING_AVERAGE = re.compile(r"^(open|high|low|close|volume)_(\d+)_(sma|ema)$")
+# Only the names stockstats accepts. It has no name for the bands of a
+# windowed Bollinger (boll_N), so only the default one comes with its bands.
+_WINDOWED = re.compile(r"^(rsi|atr|vwma|mfi|boll)(?:_(\d+))?$")
+_BOLL_BANDS = ("boll_ub", "boll_lb")
+_DEFAULT_WINDOWS = {"rsi": 14, "atr": 14, "vwma": 14, "mfi": 14, "boll": 20}
+
+
+def sma(values: np.ndarray, window: int) -> np.ndarray:
+    return pd.Series(values, dtype=float).rolling(window, min_periods=1).mean().to_numpy()
+
+
+def mov_std(values: np.ndarray, window: int) -> np.ndarray:
+    return pd.Series(values, dtype=float).rolling(window, min_periods=1).std().to_numpy()
+
+
+def mov_sum(values: np.ndarray, window: int) -> np.ndarray:
+    return pd.Series(values, dtype=float).rolling(window, min_periods=1).sum().to_numpy()
+
+
+def _cumulative_sum(values: np.ndarray, window: int) -> np.ndarray:
+    # cumsum based rolling sum, the form stockstats uses for the money flow sums
+    cumsum = np.cumsum(values)
+    out = np.empty(len(values), dtype=float)
+    out[window:] = cumsum[window:] - cumsum[:-window]
+    out[:window] = cumsum[:window]
+    return out
+
+
+def ema(values: np.ndarray, window: int) -> np.ndarray:
+    return (
+        pd.Series(values, dtype=float)
+        .ewm(ignore_na=False, span=window, min_periods=1, adjust=True)
+        .mean()
+        .to_numpy()
+    )
+
+
+def smma(values: np.ndarray, window: int) -> np.ndarray:
+    return (
+        pd.Series(values, dtype=float)
+        .ewm(ignore_na=False, alpha=1.0 / window, min_periods=0, adjust=True)
+        .mean()
+        .to_numpy()
+    )
+
+
+def _diff(values: np.ndarray) -> np.ndarray:
+    out = np.zeros(len(values), dtype=float)
+    out[1:] = np.diff(values)
+    return out
+
+
+def _prev(values: np.ndarray) -> np.ndarray:
+    out = np.empty(len(values), dtype=float)
+    if len(values):
+        out[0] = values[0]
+        out[1:] = values[:-1]
+    return out
+
+
+def typical_price(series: PriceSeries) -> np.ndarray:
+    if "amount" in series.columns:
+        return series.column("amount") / series.column("volume")
+    close = series.column("close").astype(float)
+    return (close + series.column("high") + series.column("low")) / 3.0
+
+
+def macd(close: np.ndarray, short: int = 12, long: int = 26, signal: int = 9):
+    line = ema(close, short) - ema(close, long)
+    signal_line = ema(line, signal)
+    return line, signal_line, line - signal_line
+
+
+def rsi(close: np.ndarray, window: int = 14) -> np.ndarray:
+    diff = _diff(close)
+    up = smma(np.where(diff > 0, diff, 0.0), window)
+    down = smma(np.where(diff < 0, -diff, 0.0), window)
+    total = up + down
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(total != 0, 100 * (up / total), 50.0)
+    if len(out):
+        out[0] = 50.0
+    return np.nan_to_num(out)
+
+
+def bollinger(close: np.ndarray, window: int = 20):
+    middle = sma(close, window)
+    width = BOLL_STD_TIMES * mov_std(close, window)
+    return middle, middle + width, middle - width
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    prev_close = _prev(close)
+    tr = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+    return np.nan_to_num(tr)
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, window: int = 14) -> np.ndarray:
+    return np.nan_to_num(smma(true_range(high, low, close), window))
+
+
+def vwma(tp: np.ndarray, volume: np.ndarray, window: int = 14) -> np.ndarray:
+    rolling_tpv = mov_sum(volume * tp, window)
+    rolling_vol = mov_sum(volume, window)
+    return np.divide(
+        rolling_tpv,
+        rolling_vol,
+        out=np.zeros_like(rolling_tpv, dtype=float),
+        where=rolling_vol != 0,
+    )
+
+
+def mfi(tp: np.ndarray, volume: np.ndarray, window: int = 14) -> np.ndarray:
+    raw_money_flow = tp * volume
+    tp_diff = _diff(tp)
+    pos_sum = _cumulative_sum(np.where(tp_diff > 0, raw_money_flow, 0.0), window)
+    neg_sum = _cumulative_sum(np.where(tp_diff < 0, raw_money_flow, 0.0), window)
+    total = pos_sum + neg_sum
+    out = np.divide(pos_sum, total, out=np.full_like(pos_sum, 0.5), where=total > 0)
+    out[:window] = 0.5
+    return np.nan_to_num(out)
+
+
+def _price(series: PriceSeries, name: str) -> np.ndarray:
+    return np.asarray(series.column(name), dtype=float)
+
+
+def _kernel(name: str) -> Optional[Callable[[PriceSeries], Dict[str, np.ndarray]]]:
+    """Return a function computing ``name`` (and its sibling columns), or None."""
+    match = _MOVING_AVERAGE.match(name)
+    if match:
+        column, window, kind = match.group(1), int(match.group(2)), match.group(3)
+        average = sma if kind == "sma" else ema
+        return lambda s: {name: average(_price(s, column), window)}
+
+    if name in ("macd", "macds", "macdh"):
+        def _macd(s):
+            line, signal_line, hist = macd(_price(s, "close"))
+            return {"macd": line, "macds": signal_line, "macdh": hist}
+        return _macd
+
+    match = _WINDOWED.match("boll" if name in _BOLL_BANDS else name)
+    if not match:
+        return None
+    kind = match.group(1)
+    window = int(match.group(2)) if match.group(2) else _DEFAULT_WINDOWS[kind]
+    suffix = f"_{match.group(2)}" if match.group(2) else ""
+
+    if kind == "boll":
+        def _boll(s):
+            middle, upper, lower = bollinger(_price(s, "close"), window)
+            if suffix:
+                return {name: middle}
+            return {"boll": middle, "boll_ub": upper, "boll_lb": lower}
+        return _boll
+    if kind == "rsi":
+        return lambda s: {name: rsi(_price(s, "close"), window)}
+    if kind == "atr":
+        return lambda s: {
+            name: atr(_price(s, "high"), _price(s, "low"), _price(s, "close"), window)
+        }
+    if kind == "vwma":
+        return lambda s: {name: vwma(typical_price(s), _price(s, "volume"), window)}
+    if kind == "mfi":
+        return lambda s: {name: mfi(typical_price(s), _price(s, "volume"), window)}
+    return None
+
+
+def _compute(series: PriceSeries, indicators: Iterable[str]) -> Dict[str, np.ndarray]:
+    results: Dict[str, np.ndarray] = {}
+    fallback = []
+
+    for name in indicators:
+        if name in results:
+            continue
+        kernel = _kernel(name)
+        if kernel is None:
+            fallback.append(name)
+            continue
+        results.update(kernel(series))
+
+    if fallback:
+        # Let stockstats handle anything without a native kernel, wrapping once
+        df = wrap(series.to_frame())
+        for name in fallback:
+            results[name] = np.asarray(df[name].values, dtype=float)
+
+    return results
+
+
+def compute_indicators(
+    series: PriceSeries, indicators: Iterable[str], use_cache: bool = True
+) -> Dict[str, np.ndarray]:
+    """Compute every requested indicator over the full series in one pass each.
+
+    Columns already computed for this series in the current process, or stored
+    in the persistent indicator cache for the same price data version, are
+    reused. Returns a mapping of indicator name to a float array aligned with
+    ``series.dates``.
+    """
+    names = list(dict.fromkeys(indicators))
+    results = {name: series.indicators[name] for name in names if name in series.indicators}
+    missing = [name for name in names if name not in results]
+
+    cache = get_indicator_cache() if use_cache and missing else None
+    if cache is not None:
+        try:
+            results.update(cache.get_many(series.symbol, missing, series.version, len(series)))
+        except sqlite3.Error:
+            cache = None
+        missing = [name for name in names if name not in results]
+
+    if missing:
+        computed = _compute(series, missing)
+        if cache is not None:
+            try:
+                cache.put_many(series.symbol, series.version, computed)
+            except sqlite3.Error:
+                pass
+        results.update(computed)
+
+    series.indicators.update(results)
+    return {name: results[name] for name in names}
+
+
+def indicator_window(
+    series: PriceSeries, indicator: str, start_date, end_date
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the dates and values of an indicator between two dates (inclusive)."""
+    values = compute_indicators(series, [indicator])[indicator]
+    lo, hi = series.locate(start_date, end_date)
+    return series.date_strings(lo, hi), values[lo:hi]
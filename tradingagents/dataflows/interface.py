@@ -1,18 +1,21 @@
-from typing import Annotated, Dict
-from .reddit_utils import fetch_top_from_category
+from typing import Annotated, Dict, List, Optional
+from .reddit_utils import fetch_top_from_category, fetch_top_from_category_range
 from .yfin_utils import *
 from .stockstats_utils import *
 from .googlenews_utils import *
-from .finnhub_utils import get_data_in_range
+from .finnhub_utils import get_data_in_range, unique_records
+from .price_store import get_price_store
+from .indicators import compute_indicators
+from .fundamentals_store import get_fundamentals_store
+from .utils import ToolError
 from dateutil.relativedelta import relativedelta
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
 import os
 import pandas as pd
-from tqdm import tqdm
 import yfinance as yf
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from .config import get_config, set_config, DATA_DIR
 from ..i18n import _
 
@@ -86,12 +89,8 @@ def get_finnhub_company_insider_sentiment(
         return ""
 
     result_str = ""
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
-                seen_dicts.append(entry)
+    for entry in unique_records(data):
+        result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
 
     return (
         f"## {ticker} Insider Sentiment Data for {before} to {curr_date}:\n"
@@ -127,13 +126,8 @@ def get_finnhub_company_insider_transactions(
         return ""
 
     result_str = ""
-
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
-                seen_dicts.append(entry)
+    for entry in unique_records(data):
+        result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
 
     return (
         f"## {ticker} insider transactions from {before} to {curr_date}:\n"
@@ -142,108 +136,100 @@ def get_finnhub_company_insider_transactions(
     )
 
 
-def get_simfin_balance_sheet(
+_SIMFIN_REPORT_KEYS = {
+    "balance_sheet": (
+        "dataflow.no_balance_sheet",
+        "dataflow_reports.balance_sheet_released",
+        "dataflow_reports.balance_sheet_description",
+    ),
+    "cashflow": (
+        "dataflow.no_cash_flow",
+        "dataflow_reports.cashflow_released",
+        "dataflow_reports.cashflow_description",
+    ),
+    "income_statement": (
+        "dataflow.no_income_statement",
+        "dataflow_reports.income_statement_released",
+        "dataflow_reports.income_statement_description",
+    ),
+}
+
+
+def get_simfin_fundamentals_snapshot(
     ticker: Annotated[str, "ticker symbol"],
     freq: Annotated[
         str,
         "reporting frequency of the company's financial history: annual / quarterly",
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
-):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "balance_sheet",
-        "companies",
-        "us",
-        f"us-balance-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+    statements: Annotated[
+        List[str], "statements to include, defaults to all three"
+    ] = None,
+) -> Dict[str, Optional[pd.Series]]:
+    """
+    Latest balance sheet, cash flow and income statement of a ticker published on or before curr_date.
+    Returns a dict keyed by "balance_sheet", "cashflow" and "income_statement"; a statement without any
+    report is mapped to None.
+    """
+    return get_fundamentals_store(DATA_DIR).snapshot(ticker, freq, curr_date, statements)
 
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
 
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+def _format_simfin_report(statement: str, ticker: str, freq: str, report) -> str:
+    no_report_key, released_key, description_key = _SIMFIN_REPORT_KEYS[statement]
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
-        # Initialize i18n if available
-        try:
-            from ..config_manager import ConfigManager
-            config_manager = ConfigManager()
-            current_locale = config_manager.get_locale()
-            from ..i18n import set_locale, _
-            set_locale(current_locale)
-        except:
-            def _(key: str, **kwargs) -> str:
-                return key.format(**kwargs) if kwargs else key
-        print(_("dataflow.no_balance_sheet"))
+    if report is None:
+        print(_(no_report_key))
         return ""
 
-    # Get the most recent balance sheet by selecting the row with the latest Publish Date
-    latest_balance_sheet = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
-    latest_balance_sheet = latest_balance_sheet.drop("SimFinId")
+    report = report.drop("SimFinId")
 
     return (
-        f"## {_('dataflow_reports.balance_sheet_released', freq=freq, ticker=ticker, date=str(latest_balance_sheet['Publish Date'])[0:10])} \n"
-        + str(latest_balance_sheet)
-        + "\n\n" + _("dataflow_reports.balance_sheet_description")
+        f"## {_(released_key, freq=freq, ticker=ticker, date=str(report['Publish Date'])[0:10])} \n"
+        + str(report)
+        + "\n\n" + _(description_key)
     )
 
 
-def get_simfin_cashflow(
+def get_simfin_fundamentals(
     ticker: Annotated[str, "ticker symbol"],
     freq: Annotated[
         str,
         "reporting frequency of the company's financial history: annual / quarterly",
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
-):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "cash_flow",
-        "companies",
-        "us",
-        f"us-cashflow-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+) -> str:
+    snapshot = get_simfin_fundamentals_snapshot(ticker, freq, curr_date)
+    reports = [
+        _format_simfin_report(statement, ticker, freq, report)
+        for statement, report in snapshot.items()
+    ]
+    return "\n\n".join(report for report in reports if report)
 
-    # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
-        print(_("dataflow.no_cash_flow"))
-        return ""
 
-    # Get the most recent cash flow statement by selecting the row with the latest Publish Date
-    latest_cash_flow = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
+def get_simfin_balance_sheet(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[
+        str,
+        "reporting frequency of the company's financial history: annual / quarterly",
+    ],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+):
+    snapshot = get_simfin_fundamentals_snapshot(ticker, freq, curr_date, ["balance_sheet"])
+    return _format_simfin_report("balance_sheet", ticker, freq, snapshot["balance_sheet"])
 
-    # drop the SimFinID column
-    latest_cash_flow = latest_cash_flow.drop("SimFinId")
 
-    return (
-        f"## {_('dataflow_reports.cashflow_released', freq=freq, ticker=ticker, date=str(latest_cash_flow['Publish Date'])[0:10])} \n"
-        + str(latest_cash_flow)
-        + "\n\n" + _("dataflow_reports.cashflow_description")
-    )
+def get_simfin_cashflow(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[
+        str,
+        "reporting frequency of the company's financial history: annual / quarterly",
+    ],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+):
+    snapshot = get_simfin_fundamentals_snapshot(ticker, freq, curr_date, ["cashflow"])
+    return _format_simfin_report("cashflow", ticker, freq, snapshot["cashflow"])
 
 
 def get_simfin_income_statements(
@@ -254,43 +240,8 @@ def get_simfin_income_statements(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "income_statements",
-        "companies",
-        "us",
-        f"us-income-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
-
-    # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
-        print(_("dataflow.no_income_statement"))
-        return ""
-
-    # Get the most recent income statement by selecting the row with the latest Publish Date
-    latest_income = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
-    # drop the SimFinID column
-    latest_income = latest_income.drop("SimFinId")
-
-    return (
-        f"## {_('dataflow_reports.income_statement_released', freq=freq, ticker=ticker, date=str(latest_income['Publish Date'])[0:10])} \n"
-        + str(latest_income)
-        + "\n\n" + _("dataflow_reports.income_statement_description")
-    )
+    snapshot = get_simfin_fundamentals_snapshot(ticker, freq, curr_date, ["income_statement"])
+    return _format_simfin_report("income_statement", ticker, freq, snapshot["income_statement"])
 
 
 def get_google_news(
@@ -314,7 +265,8 @@ def get_google_news(
         )
 
     if len(news_results) == 0:
-        return ""
+        # getNewsData gives up silently on request errors, so this may be a failure
+        return ToolError("")
 
     return f"## {_('dataflow_reports.google_news_from_to', query=query, before=before, curr_date=curr_date)}\n\n{news_str}"
 
@@ -337,26 +289,16 @@ def get_reddit_global_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
-
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(desc=f"Getting Global News on {start_date}", total=total_iterations)
-
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "global_news",
-            curr_date_str,
-            max_limit_per_day,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-        pbar.update(1)
+    curr_date = start_date.strftime("%Y-%m-%d")
 
-    pbar.close()
+    # the whole look-back window is served by one query on the reddit index
+    posts = fetch_top_from_category_range(
+        "global_news",
+        before,
+        curr_date,
+        max_limit_per_day,
+        data_path=os.path.join(DATA_DIR, "reddit_data"),
+    )
 
     if len(posts) == 0:
         return ""
@@ -391,32 +333,18 @@ def get_reddit_company_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
+    curr_date = start_date.strftime("%Y-%m-%d")
 
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(
-        desc=f"Getting Company News for {ticker} on {start_date}",
-        total=total_iterations,
+    # the whole look-back window is served by one query on the reddit index
+    posts = fetch_top_from_category_range(
+        "company_news",
+        before,
+        curr_date,
+        max_limit_per_day,
+        ticker,
+        data_path=os.path.join(DATA_DIR, "reddit_data"),
     )
 
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "company_news",
-            curr_date_str,
-            max_limit_per_day,
-            ticker,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-
-        pbar.update(1)
-
-    pbar.close()
-
     if len(posts) == 0:
         return ""
 
@@ -430,6 +358,80 @@ def get_reddit_company_news(
     return f"## {_('dataflow_reports.company_news_reddit_from_to', ticker=ticker, before=before, curr_date=curr_date)}\n\n{news_str}"
 
 
+best_ind_params = {
+    # Moving Averages
+    "close_50_sma": (
+        "50 SMA: A medium-term trend indicator. "
+        "Usage: Identify trend direction and serve as dynamic support/resistance. "
+        "Tips: It lags price; combine with faster indicators for timely signals."
+    ),
+    "close_200_sma": (
+        "200 SMA: A long-term trend benchmark. "
+        "Usage: Confirm overall market trend and identify golden/death cross setups. "
+        "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
+    ),
+    "close_10_ema": (
+        "10 EMA: A responsive short-term average. "
+        "Usage: Capture quick shifts in momentum and potential entry points. "
+        "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
+    ),
+    # MACD Related
+    "macd": (
+        "MACD: Computes momentum via differences of EMAs. "
+        "Usage: Look for crossovers and divergence as signals of trend changes. "
+        "Tips: Confirm with other indicators in low-volatility or sideways markets."
+    ),
+    "macds": (
+        "MACD Signal: An EMA smoothing of the MACD line. "
+        "Usage: Use crossovers with the MACD line to trigger trades. "
+        "Tips: Should be part of a broader strategy to avoid false positives."
+    ),
+    "macdh": (
+        "MACD Histogram: Shows the gap between the MACD line and its signal. "
+        "Usage: Visualize momentum strength and spot divergence early. "
+        "Tips: Can be volatile; complement with additional filters in fast-moving markets."
+    ),
+    # Momentum Indicators
+    "rsi": (
+        "RSI: Measures momentum to flag overbought/oversold conditions. "
+        "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
+        "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
+    ),
+    # Volatility Indicators
+    "boll": (
+        "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
+        "Usage: Acts as a dynamic benchmark for price movement. "
+        "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
+    ),
+    "boll_ub": (
+        "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
+        "Usage: Signals potential overbought conditions and breakout zones. "
+        "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
+    ),
+    "boll_lb": (
+        "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
+        "Usage: Indicates potential oversold conditions. "
+        "Tips: Use additional analysis to avoid false reversal signals."
+    ),
+    "atr": (
+        "ATR: Averages true range to measure volatility. "
+        "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
+        "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
+    ),
+    # Volume-Based Indicators
+    "vwma": (
+        "VWMA: A moving average weighted by volume. "
+        "Usage: Confirm trends by integrating price action with volume data. "
+        "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+    ),
+    "mfi": (
+        "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
+        "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
+        "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
+    ),
+}
+
+
 def get_stock_stats_indicators_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -440,79 +442,6 @@ def get_stock_stats_indicators_window(
     online: Annotated[bool, "to fetch data online or offline"],
 ) -> str:
 
-    best_ind_params = {
-        # Moving Averages
-        "close_50_sma": (
-            "50 SMA: A medium-term trend indicator. "
-            "Usage: Identify trend direction and serve as dynamic support/resistance. "
-            "Tips: It lags price; combine with faster indicators for timely signals."
-        ),
-        "close_200_sma": (
-            "200 SMA: A long-term trend benchmark. "
-            "Usage: Confirm overall market trend and identify golden/death cross setups. "
-            "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
-        ),
-        "close_10_ema": (
-            "10 EMA: A responsive short-term average. "
-            "Usage: Capture quick shifts in momentum and potential entry points. "
-            "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
-        ),
-        # MACD Related
-        "macd": (
-            "MACD: Computes momentum via differences of EMAs. "
-            "Usage: Look for crossovers and divergence as signals of trend changes. "
-            "Tips: Confirm with other indicators in low-volatility or sideways markets."
-        ),
-        "macds": (
-            "MACD Signal: An EMA smoothing of the MACD line. "
-            "Usage: Use crossovers with the MACD line to trigger trades. "
-            "Tips: Should be part of a broader strategy to avoid false positives."
-        ),
-        "macdh": (
-            "MACD Histogram: Shows the gap between the MACD line and its signal. "
-            "Usage: Visualize momentum strength and spot divergence early. "
-            "Tips: Can be volatile; complement with additional filters in fast-moving markets."
-        ),
-        # Momentum Indicators
-        "rsi": (
-            "RSI: Measures momentum to flag overbought/oversold conditions. "
-            "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
-            "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
-        ),
-        # Volatility Indicators
-        "boll": (
-            "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
-            "Usage: Acts as a dynamic benchmark for price movement. "
-            "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
-        ),
-        "boll_ub": (
-            "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
-            "Usage: Signals potential overbought conditions and breakout zones. "
-            "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
-        ),
-        "boll_lb": (
-            "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
-            "Usage: Indicates potential oversold conditions. "
-            "Tips: Use additional analysis to avoid false reversal signals."
-        ),
-        "atr": (
-            "ATR: Averages true range to measure volatility. "
-            "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
-            "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
-        ),
-        # Volume-Based Indicators
-        "vwma": (
-            "VWMA: A moving average weighted by volume. "
-            "Usage: Confirm trends by integrating price action with volume data. "
-            "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
-        ),
-        "mfi": (
-            "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
-            "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
-            "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
-        ),
-    }
-
     if indicator not in best_ind_params:
         raise ValueError(
             _("dataflow_reports.error_indicator_not_supported", indicator=indicator, indicators=list(best_ind_params.keys()))
@@ -521,36 +450,40 @@ def get_stock_stats_indicators_window(
     end_date = curr_date
     curr_date = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date - relativedelta(days=look_back_days)
+    price_dir = os.path.join(DATA_DIR, "market_data", "price_data")
 
     if not online:
-        # read from YFin data
-        data = pd.read_csv(
-            os.path.join(
-                DATA_DIR,
-                f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-            )
-        )
-        data["Date"] = pd.to_datetime(data["Date"], utc=True)
-        dates_in_df = data["Date"].astype(str).str[:10]
+        # compute the indicator once over the full history, then slice the window
+        prices = StockstatsUtils.get_price_series(symbol, price_dir, online=False)
+        values = compute_indicators(prices, [indicator])[indicator]
+        lo, hi = prices.locate(before, curr_date)
+        dates = prices.date_strings(lo, hi)
 
         ind_string = ""
-        while curr_date >= before:
-            # only do the trading dates
-            if curr_date.strftime("%Y-%m-%d") in dates_in_df.values:
-                indicator_value = get_stockstats_indicator(
-                    symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-                )
-
-                ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
-
-            curr_date = curr_date - relativedelta(days=1)
+        # only the trading dates, most recent first
+        for i in range(hi - lo - 1, -1, -1):
+            ind_string += f"{dates[i]}: {values[lo + i]}\n"
     else:
         # online gathering
+        try:
+            prices = StockstatsUtils.get_price_series(symbol, price_dir, online=True)
+            values = compute_indicators(prices, [indicator])[indicator]
+        except Exception as e:
+            print(
+                _("dataflow_reports.error_getting_indicator_data", indicator=indicator, curr_date=end_date, error=e)
+            )
+            prices = None
+
         ind_string = ""
         while curr_date >= before:
-            indicator_value = get_stockstats_indicator(
-                symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-            )
+            if prices is None:
+                indicator_value = ""
+            else:
+                row = prices.index_of(curr_date)
+                if row is None:
+                    indicator_value = _("error.not_trading_day")
+                else:
+                    indicator_value = values[row]
 
             ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
 
@@ -563,9 +496,65 @@ def get_stock_stats_indicators_window(
         + best_ind_params.get(indicator, _("reports.no_description_available"))
     )
 
+    if online and prices is None:
+        return ToolError(result_str)
     return result_str
 
 
+def get_stock_stats_indicators_batch(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[
+        List[str], "technical indicators to get the analysis and report of"
+    ],
+    curr_date: Annotated[
+        str, "The current trading date you are trading on, YYYY-mm-dd"
+    ],
+    look_back_days: Annotated[int, "how many days to look back"],
+    online: Annotated[bool, "to fetch data online or offline"],
+) -> str:
+    """
+    Report several indicators over one window as a single table.
+
+    The price history is loaded once and every indicator is computed in the
+    same pass, so this replaces one get_stock_stats_indicators_window call
+    (and one tool round trip) per indicator.
+    """
+
+    indicators = list(dict.fromkeys(indicators))
+    unsupported = [name for name in indicators if name not in best_ind_params]
+    if not indicators or unsupported:
+        raise ValueError(
+            _("dataflow_reports.error_indicator_not_supported", indicator=", ".join(unsupported), indicators=list(best_ind_params.keys()))
+        )
+
+    curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
+    before = (curr_date_dt - relativedelta(days=look_back_days)).strftime("%Y-%m-%d")
+
+    prices = StockstatsUtils.get_price_series(
+        symbol, os.path.join(DATA_DIR, "market_data", "price_data"), online=online
+    )
+    values = compute_indicators(prices, indicators)
+    lo, hi = prices.locate(before, curr_date)
+
+    table = pd.DataFrame(
+        {name: values[name][lo:hi] for name in indicators},
+        index=pd.Index(prices.date_strings(lo, hi), name="Date"),
+    )
+    # most recent trading day first, like the single indicator report
+    table_str = table.iloc[::-1].to_csv(float_format="%.4f")
+
+    descriptions = "\n".join(
+        f"- {name}: {best_ind_params[name]}" for name in indicators
+    )
+
+    return (
+        f"## {_('dataflow_reports.indicator_table_from_to', symbol=symbol, before=before, end_date=curr_date)}\n\n"
+        + table_str
+        + "\n"
+        + descriptions
+    )
+
+
 def get_stockstats_indicator(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -590,7 +579,7 @@ def get_stockstats_indicator(
         print(
             _("dataflow_reports.error_getting_indicator_data", indicator=indicator, curr_date=curr_date, error=e)
         )
-        return ""
+        return ToolError("")
 
     return str(indicator_value)
 
@@ -605,24 +594,10 @@ def get_YFin_data_window(
     before = date_obj - relativedelta(days=look_back_days)
     start_date = before.strftime("%Y-%m-%d")
 
-    # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
-
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
-    # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= curr_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    # Slice the date range (inclusive) out of the columnar price store
+    filtered_data = get_price_store(
+        os.path.join(DATA_DIR, "market_data", "price_data")
+    ).window(symbol, start_date, curr_date)
 
     # Set pandas display options to show the full DataFrame
     with pd.option_context(
@@ -651,9 +626,9 @@ def get_YFin_data_online(
     # Fetch historical data for the specified date range
     data = ticker.history(start=start_date, end=end_date)
 
-    # Check if data is empty
+    # Check if data is empty; yfinance also returns no rows when the request failed
     if data.empty:
-        return (
+        return ToolError(
             _("dataflow_reports.no_data_found", symbol=symbol, start_date=start_date, end_date=end_date)
         )
 
@@ -684,28 +659,17 @@ def get_YFin_data(
     end_date: Annotated[str, "End date in yyyy-mm-dd format"],
 ) -> str:
     # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
+    prices = get_price_store(
+        os.path.join(DATA_DIR, "market_data", "price_data")
+    ).load(symbol)
 
     if end_date > "2025-03-25":
         raise Exception(
             _("dataflow_reports.data_outside_range", end_date=end_date)
         )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
     # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    filtered_data = prices.window(start_date, end_date)
 
     # remove the index from the dataframe
     filtered_data = filtered_data.reset_index(drop=True)
@@ -713,67 +677,79 @@ def get_YFin_data(
     return filtered_data
 
 
-def get_stock_news_openai(ticker, curr_date):
+def _openai_search_request(prompt: str) -> Dict:
     config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+    return {
+        "model": config["quick_think_llm"],
+        "messages": [
+            {
+                "role": "system",
+                "content": prompt,
+            }
+        ],
+        "temperature": 1,
+        "max_tokens": 4096,
+        "top_p": 1,
+    }
+
+
+def _openai_search(prompt: str, error_key: str) -> str:
+    client = OpenAI(base_url=get_config()["backend_url"])
 
     try:
-        response = client.chat.completions.create(
-            model=config["quick_think_llm"],
-            messages=[
-                {
-                    "role": "system",
-                    "content": _("dataflow_reports.search_social_media_prompt", ticker=ticker, curr_date=curr_date)
-                }
-            ],
-            temperature=1,
-            max_tokens=4096,
-            top_p=1,
-        )
+        response = client.chat.completions.create(**_openai_search_request(prompt))
         return response.choices[0].message.content
     except Exception as e:
-        return _("dataflow_reports.error_fetching_news", error=str(e))
+        return ToolError(_(error_key, error=str(e)))
 
 
-def get_global_news_openai(curr_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+async def _aopenai_search(prompt: str, error_key: str) -> str:
+    client = AsyncOpenAI(base_url=get_config()["backend_url"])
 
     try:
-        response = client.chat.completions.create(
-            model=config["quick_think_llm"],
-            messages=[
-                {
-                    "role": "system",
-                    "content": _("dataflow_reports.search_global_news_prompt", curr_date=curr_date)
-                }
-            ],
-            temperature=1,
-            max_tokens=4096,
-            top_p=1,
-        )
+        response = await client.chat.completions.create(**_openai_search_request(prompt))
         return response.choices[0].message.content
     except Exception as e:
-        return _("dataflow_reports.error_fetching_global_news", error=str(e))
+        return ToolError(_(error_key, error=str(e)))
+
+
+def get_stock_news_openai(ticker, curr_date):
+    return _openai_search(
+        _("dataflow_reports.search_social_media_prompt", ticker=ticker, curr_date=curr_date),
+        "dataflow_reports.error_fetching_news",
+    )
+
+
+async def aget_stock_news_openai(ticker, curr_date):
+    return await _aopenai_search(
+        _("dataflow_reports.search_social_media_prompt", ticker=ticker, curr_date=curr_date),
+        "dataflow_reports.error_fetching_news",
+    )
+
+
+def get_global_news_openai(curr_date):
+    return _openai_search(
+        _("dataflow_reports.search_global_news_prompt", curr_date=curr_date),
+        "dataflow_reports.error_fetching_global_news",
+    )
+
+
+async def aget_global_news_openai(curr_date):
+    return await _aopenai_search(
+        _("dataflow_reports.search_global_news_prompt", curr_date=curr_date),
+        "dataflow_reports.error_fetching_global_news",
+    )
 
 
 def get_fundamentals_openai(ticker, curr_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+    return _openai_search(
+        _("dataflow_reports.search_fundamentals_prompt", ticker=ticker, curr_date=curr_date),
+        "dataflow_reports.error_fetching_fundamentals",
+    )
 
-    try:
-        response = client.chat.completions.create(
-            model=config["quick_think_llm"],
-            messages=[
-                {
-                    "role": "system",
-                    "content": _("dataflow_reports.search_fundamentals_prompt", ticker=ticker, curr_date=curr_date)
-                }
-            ],
-            temperature=1,
-            max_tokens=4096,
-            top_p=1,
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        return _("dataflow_reports.error_fetching_fundamentals", error=str(e))
+
+async def aget_fundamentals_openai(ticker, curr_date):
+    return await _aopenai_search(
+        _("dataflow_reports.search_fundamentals_prompt", ticker=ticker, curr_date=curr_date),
+        "dataflow_reports.error_fetching_fundamentals",
+    )
@@ -0,0 +1,230 @@
+"""
+Incremental cache of online price history.
+
+Each symbol keeps a single ``{symbol}-YFin-data-history.csv`` file in the
+dataflow cache directory. On every load only the bars after the last cached
+one are requested from the downloader and appended, instead of fetching the
+whole 15 year range again whenever the date changes. The dated files written
+by earlier versions are used to seed the history and then removed.
+
+The downloader is pluggable: ``yfinance_download`` fetches from Yahoo Finance,
+``LocalPriceDownloader`` serves the offline price CSVs so the cache can be
+exercised without network access (``online_price_source: "local"``).
+"""
+
+import json
+import os
+import re
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config, get_data_cache_dir
+from .price_store import YFIN_DATA_FILE, PriceSeries
+
+HISTORY_YEARS = 15
+
+# (symbol, start, end) -> frame with a Date column; start inclusive, end exclusive
+Downloader = Callable[[str, str, str], pd.DataFrame]
+
+_PRICE_COLUMNS = ["Close", "High", "Low", "Open", "Volume"]
+
+
+def yfinance_download(symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+    data = yf.download(
+        symbol,
+        start=start_date,
+        end=end_date,
+        multi_level_index=False,
+        progress=False,
+        auto_adjust=True,
+    )
+    return data.reset_index()
+
+
+class LocalPriceDownloader:
+    """Stand-in downloader that serves the offline Yahoo Finance CSV files."""
+
+    def __init__(self, data_dir: str):
+        self.data_dir = data_dir
+
+    def __call__(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+        path = os.path.join(self.data_dir, YFIN_DATA_FILE.format(symbol=symbol))
+        if not os.path.exists(path):
+            return pd.DataFrame(columns=["Date"] + _PRICE_COLUMNS)
+
+        data = pd.read_csv(path)
+        dates = data["Date"].astype(str).str[:10]
+        data = data[(dates >= start_date) & (dates < end_date)]
+        return data[["Date"] + [c for c in _PRICE_COLUMNS if c in data.columns]]
+
+
+class OnlinePriceCache:
+    """Keeps one growing price history per symbol and fetches only the missing tail."""
+
+    def __init__(self, cache_dir: str, downloader: Optional[Downloader] = None):
+        self.cache_dir = cache_dir
+        self.downloader = downloader or yfinance_download
+        self._series: Dict[str, Tuple[str, PriceSeries]] = {}
+        # One lock per symbol, so loads of different symbols fetch concurrently
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def history_path(self, symbol: str) -> str:
+        return os.path.join(self.cache_dir, f"{symbol}-YFin-data-history.csv")
+
+    def _meta_path(self, symbol: str) -> str:
+        return os.path.join(self.cache_dir, f"{symbol}-YFin-data-history.json")
+
+    def load(self, symbol: str, today: Optional[str] = None) -> PriceSeries:
+        """Return the price history of a symbol up to (excluding) today."""
+        today = today or pd.Timestamp.today().strftime("%Y-%m-%d")
+
+        with self._lock:
+            symbol_lock = self._symbol_locks.setdefault(symbol, threading.Lock())
+
+        with symbol_lock:
+            cached = self._series.get(symbol)
+            if cached is not None and cached[0] == today:
+                return cached[1]
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            data = self._update(symbol, today)
+            series = PriceSeries.from_frame(symbol, data)
+            self._series[symbol] = (today, series)
+            self._collect_garbage(symbol)
+        return series
+
+    def _update(self, symbol: str, today: str) -> pd.DataFrame:
+        meta = self._read_meta(symbol)
+        data = self._read_history(symbol)
+
+        if data is None:
+            data = self._read_legacy(symbol)
+            meta = {}
+        if data is None or data.empty:
+            start = (pd.Timestamp(today) - pd.DateOffset(years=HISTORY_YEARS)).strftime(
+                "%Y-%m-%d"
+            )
+            data = self._download(symbol, start, today)
+            self._write(symbol, data, today)
+            return data
+
+        if meta.get("checked") == today:
+            return data
+
+        last_date = data["Date"].iloc[-1]
+        tail = self._download(symbol, last_date, today)
+        if tail.empty:
+            self._write_meta(symbol, today)
+            return data
+
+        overlap = tail[tail["Date"] == last_date]
+        if not overlap.empty and not _same_bar(data.iloc[-1], overlap.iloc[0]):
+            # Adjusted prices moved (dividend or split), so the cached history is stale
+            start = data["Date"].iloc[0]
+            data = self._download(symbol, start, today)
+        else:
+            data = pd.concat([data, tail[tail["Date"] > last_date]], ignore_index=True)
+
+        self._write(symbol, data, today)
+        return data
+
+    def _download(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+        data = self.downloader(symbol, start_date, end_date)
+        if data is None or data.empty:
+            return pd.DataFrame(columns=["Date"] + _PRICE_COLUMNS)
+        data = data.copy()
+        data["Date"] = pd.to_datetime(data["Date"]).dt.strftime("%Y-%m-%d")
+        return data.drop_duplicates("Date", keep="last").sort_values("Date").reset_index(drop=True)
+
+    def _read_history(self, symbol: str) -> Optional[pd.DataFrame]:
+        path = self.history_path(symbol)
+        if not os.path.exists(path):
+            return None
+        data = pd.read_csv(path)
+        data["Date"] = data["Date"].astype(str).str[:10]
+        return data
+
+    def _read_legacy(self, symbol: str) -> Optional[pd.DataFrame]:
+        # Seed from the newest dated file left by the full-download cache
+        legacy = sorted(self._legacy_files(symbol))
+        if not legacy:
+            return None
+        data = pd.read_csv(os.path.join(self.cache_dir, legacy[-1]))
+        data["Date"] = data["Date"].astype(str).str[:10]
+        return data.sort_values("Date").reset_index(drop=True)
+
+    def _legacy_files(self, symbol: str):
+        pattern = re.compile(
+            rf"^{re.escape(symbol)}-YFin-data-\d{{4}}-\d{{2}}-\d{{2}}-\d{{4}}-\d{{2}}-\d{{2}}\.csv$"
+        )
+        try:
+            return [name for name in os.listdir(self.cache_dir) if pattern.match(name)]
+        except OSError:
+            return []
+
+    def _collect_garbage(self, symbol: str):
+        if not os.path.exists(self.history_path(symbol)):
+            return
+        for name in self._legacy_files(symbol):
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except OSError:
+                pass
+
+    def _read_meta(self, symbol: str) -> Dict:
+        try:
+            with open(self._meta_path(symbol), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_meta(self, symbol: str, today: str):
+        tmp_path = f"{self._meta_path(symbol)}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"checked": today}, f)
+        os.replace(tmp_path, self._meta_path(symbol))
+
+    def _write(self, symbol: str, data: pd.DataFrame, today: str):
+        path = self.history_path(symbol)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        data.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        self._write_meta(symbol, today)
+
+
+def _same_bar(cached: pd.Series, fetched: pd.Series) -> bool:
+    for name in ("Close", "Open", "High", "Low"):
+        if name in cached.index and name in fetched.index:
+            a, b = float(cached[name]), float(fetched[name])
+            if abs(a - b) > 1e-6 * max(1.0, abs(a)):
+                return False
+    return True
+
+
+_caches: Dict[Tuple[str, str], OnlinePriceCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_online_price_cache() -> OnlinePriceCache:
+    """Return the shared online price cache for the configured downloader."""
+    config = get_config()
+    source = config.get("online_price_source", "yfinance")
+    cache_dir = os.path.abspath(get_data_cache_dir())
+
+    with _caches_lock:
+        cache = _caches.get((cache_dir, source))
+        if cache is None:
+            if source == "local":
+                data_dir = config.get("data_dir") or config["project_settings"]["data_dir"]
+                downloader = LocalPriceDownloader(
+                    os.path.join(data_dir, "market_data", "price_data")
+                )
+            else:
+                downloader = yfinance_download
+            cache = OnlinePriceCache(cache_dir, downloader)
+            _caches[(cache_dir, source)] = cache
+    return cache
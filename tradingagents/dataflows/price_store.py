@@ -0,0 +1,236 @@
+"""
+Columnar price store for the offline Yahoo Finance market data.
+
+Each ``{symbol}-YFin-data-2015-01-01-2025-03-25.csv`` file is parsed once into
+a date-sorted set of typed NumPy columns. The columns are persisted under the
+dataflow cache directory as ``.npy`` files and re-opened memory-mapped by later
+processes, so the CSV is only parsed again when the source file changes.
+Date ranges are resolved with a binary search over the date index.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import get_data_cache_dir
+from .utils import file_signature
+
+YFIN_DATA_FILE = "{symbol}-YFin-data-2015-01-01-2025-03-25.csv"
+
+
+def _to_day(date) -> np.datetime64:
+    """Convert a YYYY-mm-dd string (or datetime-like) to a day precision datetime64."""
+    if isinstance(date, str):
+        return np.datetime64(date[:10], "D")
+    return np.datetime64(pd.Timestamp(date).strftime("%Y-%m-%d"), "D")
+
+
+class PriceSeries:
+    """Date-indexed, column oriented price history of a single symbol."""
+
+    def __init__(
+        self,
+        symbol: str,
+        dates: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        version: Optional[str] = None,
+    ):
+        self.symbol = symbol
+        self.dates = dates
+        self.columns = columns
+        # Content hash of the source data; keys the persistent indicator cache
+        self.version = version or _content_digest(dates, columns)
+        self.indicators: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def from_frame(
+        cls, symbol: str, data: pd.DataFrame, version: Optional[str] = None
+    ) -> "PriceSeries":
+        """Build a series from a frame with a ``Date`` column and price columns."""
+        data = data.copy()
+        dates = data.pop("Date").astype(str).str[:10].to_numpy(dtype=str).astype("datetime64[D]")
+
+        order = np.argsort(dates, kind="stable")
+        columns = {}
+        for name in data.columns:
+            values = data[name].to_numpy()
+            if values.dtype == object:
+                values = values.astype(str)
+            columns[name] = values[order]
+
+        return cls(symbol, dates[order], columns, version)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a price column, matching ``close`` to ``Close`` like stockstats does."""
+        for candidate in (name, name.capitalize(), name.lower()):
+            if candidate in self.columns:
+                return self.columns[candidate]
+        raise KeyError(name)
+
+    def locate(self, start_date, end_date) -> Tuple[int, int]:
+        """Return the [lo, hi) row bounds of the inclusive date range."""
+        lo = int(np.searchsorted(self.dates, _to_day(start_date), side="left"))
+        hi = int(np.searchsorted(self.dates, _to_day(end_date), side="right"))
+        return lo, max(lo, hi)
+
+    def index_of(self, date) -> Optional[int]:
+        """Return the row of a trading date, or None if the market was closed."""
+        day = _to_day(date)
+        pos = int(np.searchsorted(self.dates, day, side="left"))
+        if pos < len(self.dates) and self.dates[pos] == day:
+            return pos
+        return None
+
+    def date_strings(self, lo: int = 0, hi: Optional[int] = None) -> np.ndarray:
+        """Return the dates of rows [lo, hi) formatted as YYYY-mm-dd."""
+        return np.datetime_as_string(self.dates[lo:hi], unit="D")
+
+    def to_frame(self, lo: int = 0, hi: Optional[int] = None) -> pd.DataFrame:
+        """Materialize rows [lo, hi) as a DataFrame shaped like the source CSV."""
+        hi = len(self.dates) if hi is None else hi
+        data = {"Date": self.date_strings(lo, hi)}
+        for name, values in self.columns.items():
+            data[name] = np.asarray(values[lo:hi])
+        return pd.DataFrame(data, index=pd.RangeIndex(lo, hi))
+
+    def window(self, start_date, end_date) -> pd.DataFrame:
+        """Return the rows between start_date and end_date (inclusive)."""
+        lo, hi = self.locate(start_date, end_date)
+        return self.to_frame(lo, hi)
+
+
+class PriceStore:
+    """Loads each symbol once and keeps a memory-mapped columnar copy on disk."""
+
+    def __init__(self, data_dir: str, cache_dir: Optional[str] = None):
+        self.data_dir = data_dir
+        self.cache_dir = cache_dir or os.path.join(get_data_cache_dir(), "price_store")
+        self._series: Dict[str, PriceSeries] = {}
+        self._lock = threading.Lock()
+
+    def source_path(self, symbol: str) -> str:
+        return os.path.join(self.data_dir, YFIN_DATA_FILE.format(symbol=symbol))
+
+    def load(self, symbol: str) -> PriceSeries:
+        """Return the price series of a symbol, parsing the CSV only if needed."""
+        series = self._series.get(symbol)
+        if series is not None:
+            return series
+
+        with self._lock:
+            series = self._series.get(symbol)
+            if series is None:
+                source = self.source_path(symbol)
+                if not os.path.exists(source):
+                    raise FileNotFoundError(source)
+                signature = file_signature(source)
+                series = self._read_columnar(symbol, signature)
+                if series is None:
+                    series = self._parse_csv(symbol, source)
+                    self._write_columnar(series, signature)
+                self._series[symbol] = series
+        return series
+
+    def window(self, symbol: str, start_date, end_date) -> pd.DataFrame:
+        return self.load(symbol).window(start_date, end_date)
+
+    def invalidate(self, symbol: Optional[str] = None):
+        """Drop in-process copies so the next load re-checks the source file."""
+        with self._lock:
+            if symbol is None:
+                self._series.clear()
+            else:
+                self._series.pop(symbol, None)
+
+    @staticmethod
+    def _parse_csv(symbol: str, source: str) -> PriceSeries:
+        return PriceSeries.from_frame(symbol, pd.read_csv(source), _file_digest(source))
+
+    def _symbol_dir(self, symbol: str) -> str:
+        return os.path.join(self.cache_dir, symbol)
+
+    def _read_columnar(self, symbol: str, signature: Dict) -> Optional[PriceSeries]:
+        symbol_dir = self._symbol_dir(symbol)
+        meta_path = os.path.join(symbol_dir, "meta.json")
+        try:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            if meta.get("source") != signature:
+                return None
+
+            dates = np.load(os.path.join(symbol_dir, "dates.npy"), mmap_mode="r")
+            columns = {
+                name: np.load(os.path.join(symbol_dir, f"col_{i}.npy"), mmap_mode="r")
+                for i, name in enumerate(meta["columns"])
+            }
+        except (OSError, ValueError, KeyError):
+            return None
+
+        return PriceSeries(symbol, dates, columns, meta.get("version"))
+
+    def _write_columnar(self, series: PriceSeries, signature: Dict):
+        symbol_dir = self._symbol_dir(series.symbol)
+        try:
+            os.makedirs(symbol_dir, exist_ok=True)
+            _save_array(os.path.join(symbol_dir, "dates.npy"), series.dates)
+            names: List[str] = list(series.columns)
+            for i, name in enumerate(names):
+                _save_array(os.path.join(symbol_dir, f"col_{i}.npy"), series.columns[name])
+
+            # meta.json is written last so a partial write is never picked up
+            tmp_path = os.path.join(symbol_dir, f"meta.json.{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {"source": signature, "version": series.version, "columns": names}, f
+                )
+            os.replace(tmp_path, os.path.join(symbol_dir, "meta.json"))
+        except OSError:
+            # The columnar copy is only an accelerator; the in-memory series is still valid
+            pass
+
+
+def _save_array(path: str, values: np.ndarray):
+    # Replace instead of truncating: other processes may have the old file memory-mapped
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, values)
+    os.replace(tmp_path, path)
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _content_digest(dates: np.ndarray, columns: Dict[str, np.ndarray]) -> str:
+    digest = hashlib.sha1(np.ascontiguousarray(dates).tobytes())
+    for name, values in columns.items():
+        digest.update(name.encode("utf-8"))
+        digest.update(np.ascontiguousarray(values).tobytes())
+    return digest.hexdigest()
+
+
+_stores: Dict[str, PriceStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_price_store(data_dir: str) -> PriceStore:
+    """Return the shared price store for a price data directory."""
+    key = os.path.abspath(data_dir)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = PriceStore(data_dir)
+            _stores[key] = store
+    return store
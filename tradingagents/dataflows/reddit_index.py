@@ -0,0 +1,216 @@
+"""
+SQLite index of the offline Reddit dumps.
+
+The ``reddit_data/{category}/{subreddit}.jsonl`` files are parsed once and
+every post is stored with its category, source file and UTC posting date,
+indexed on (category, date). A date range of a category is then served by a
+single indexed query instead of re-reading every file for every day. Files
+are re-indexed automatically when their size or modification time changes;
+``build_reddit_index`` (or ``python -m tradingagents.dataflows.reddit_index``)
+builds the whole index ahead of time.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .config import get_data_cache_dir
+from .utils import file_signature
+
+
+class RedditIndex:
+    """Posts of one reddit data folder partitioned by (category, UTC date)."""
+
+    def __init__(self, data_path: str, index_path: str):
+        self.data_path = data_path
+        self.index_path = index_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._checked: Dict[str, Tuple] = {}
+        os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sources (
+                    category TEXT NOT NULL,
+                    file TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    PRIMARY KEY (category, file)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS posts (
+                    category TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    file TEXT NOT NULL,
+                    line INTEGER NOT NULL,
+                    title TEXT,
+                    content TEXT,
+                    url TEXT,
+                    upvotes
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS posts_by_day ON posts (category, date, file)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite connections must not be shared across threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.index_path, timeout=60)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def files(self, category: str) -> List[str]:
+        """Return the entries of a category folder in directory order."""
+        return os.listdir(os.path.join(self.data_path, category))
+
+    def ensure_indexed(self, category: str):
+        """(Re-)index the files of a category that are new or have changed."""
+        signatures = {}
+        for name in self.files(category):
+            if name.endswith(".jsonl"):
+                signature = file_signature(os.path.join(self.data_path, category, name))
+                signatures[name] = (signature["size"], signature["mtime_ns"])
+        state = tuple(sorted(signatures.items()))
+        if self._checked.get(category) == state:
+            return
+
+        with self._lock:
+            if self._checked.get(category) == state:
+                return
+            conn = self._connect()
+            indexed = {
+                name: (size, mtime_ns)
+                for name, size, mtime_ns in conn.execute(
+                    "SELECT file, size, mtime_ns FROM sources WHERE category = ?",
+                    (category,),
+                )
+            }
+            with conn:
+                for name in set(indexed) - set(signatures):
+                    self._drop_file(conn, category, name)
+                for name, signature in signatures.items():
+                    if indexed.get(name) != signature:
+                        self._index_file(conn, category, name, signature)
+            self._checked[category] = state
+
+    @staticmethod
+    def _drop_file(conn: sqlite3.Connection, category: str, name: str):
+        conn.execute("DELETE FROM posts WHERE category = ? AND file = ?", (category, name))
+        conn.execute("DELETE FROM sources WHERE category = ? AND file = ?", (category, name))
+
+    def _index_file(
+        self, conn: sqlite3.Connection, category: str, name: str, signature: Tuple[int, int]
+    ):
+        self._drop_file(conn, category, name)
+        conn.executemany(
+            "INSERT INTO posts VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (category, date, name, line, title, content, url, upvotes)
+                for line, date, title, content, url, upvotes in _read_posts(
+                    os.path.join(self.data_path, category, name)
+                )
+            ),
+        )
+        conn.execute(
+            "INSERT INTO sources VALUES (?, ?, ?, ?)", (category, name, *signature)
+        )
+
+    def query(
+        self, category: str, start_date: str, end_date: str
+    ) -> Iterator[Tuple[str, str, Dict]]:
+        """
+        Yield (date, file, post) for every post of a category dated within
+        [start_date, end_date], ordered by date, file and upvotes (descending).
+        """
+        self.ensure_indexed(category)
+        rows = self._connect().execute(
+            "SELECT date, file, title, content, url, upvotes FROM posts "
+            "WHERE category = ? AND date BETWEEN ? AND ? "
+            "ORDER BY date, file, upvotes DESC, line",
+            (category, start_date, end_date),
+        )
+        for date, name, title, content, url, upvotes in rows:
+            yield date, name, {
+                "title": title,
+                "content": content,
+                "url": url,
+                "upvotes": upvotes,
+                "posted_date": date,
+            }
+
+
+def _read_posts(path: str) -> Iterator[Tuple]:
+    with open(path, "rb") as f:
+        for line_number, line in enumerate(f):
+            # skip empty lines
+            if not line.strip():
+                continue
+            parsed_line = json.loads(line)
+            post_date = datetime.fromtimestamp(
+                parsed_line["created_utc"], tz=timezone.utc
+            ).strftime("%Y-%m-%d")
+            yield (
+                line_number,
+                post_date,
+                parsed_line["title"],
+                parsed_line["selftext"],
+                parsed_line["url"],
+                parsed_line["ups"],
+            )
+
+
+_indexes: Dict[str, RedditIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_reddit_index(data_path: str) -> RedditIndex:
+    """Return the shared index of a reddit data folder."""
+    key = os.path.abspath(data_path)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+            index_path = os.path.join(get_data_cache_dir(), f"reddit_index-{digest}.sqlite")
+            index = RedditIndex(data_path, index_path)
+            _indexes[key] = index
+    return index
+
+
+def build_reddit_index(data_path: str, categories: Optional[Iterable[str]] = None) -> RedditIndex:
+    """Index every category folder (or the given ones) of a reddit data folder."""
+    index = get_reddit_index(data_path)
+    if categories is None:
+        categories = [
+            name
+            for name in sorted(os.listdir(data_path))
+            if os.path.isdir(os.path.join(data_path, name))
+        ]
+    for category in categories:
+        index.ensure_indexed(category)
+    return index
+
+
+if __name__ == "__main__":
+    import sys
+
+    from .config import get_config
+
+    config = get_config()
+    reddit_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        config["project_settings"]["data_dir"], "reddit_data"
+    )
+    built = build_reddit_index(reddit_path)
+    print(f"Indexed {reddit_path} into {built.index_path}")
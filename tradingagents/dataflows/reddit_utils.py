@@ -3,9 +3,11 @@ import time
 import json
 from datetime import datetime, timedelta
 from contextlib import contextmanager
-from typing import Annotated
+from typing import Annotated, Dict, Iterable, List
 import os
 import re
+import threading
+from .reddit_index import get_reddit_index
 
 ticker_to_company = {
     "AAPL": "Apple",
@@ -49,87 +51,122 @@ ticker_to_company = {
 }
 
 
-def fetch_top_from_category(
-    category: Annotated[
-        str, "Category to fetch top post from. Collection of subreddits."
-    ],
-    date: Annotated[str, "Date to fetch top posts from."],
-    max_limit: Annotated[int, "Maximum number of posts to fetch."],
-    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
-    data_path: Annotated[
-        str,
-        "Path to the data folder. Default is 'reddit_data'.",
-    ] = "reddit_data",
-):
-    base_path = data_path
+class CompanyMentionMatcher:
+    """
+    Finds company mentions in post text.
+    Each ticker's aliases (its company names plus the ticker itself) are compiled
+    into one case-insensitive pattern the first time the ticker is looked up.
+    """
 
-    all_content = []
+    def __init__(self, companies: Dict[str, str] = None):
+        self.companies = ticker_to_company if companies is None else companies
+        self._patterns: Dict[str, re.Pattern] = {}
+        self._lock = threading.Lock()
 
-    if max_limit < len(os.listdir(os.path.join(base_path, category))):
-        raise ValueError(
-            "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
-        )
+    def aliases(self, ticker: str) -> List[str]:
+        names = self.companies.get(ticker)
+        terms = names.split(" OR ") if names else []
+        terms.append(ticker)
+        return [term for term in dict.fromkeys(terms) if term]
 
-    limit_per_subreddit = max_limit // len(
-        os.listdir(os.path.join(base_path, category))
-    )
+    def pattern(self, ticker: str) -> re.Pattern:
+        """Return the compiled pattern matching any alias of a ticker."""
+        compiled = self._patterns.get(ticker)
+        if compiled is None:
+            with self._lock:
+                compiled = self._patterns.get(ticker)
+                if compiled is None:
+                    compiled = re.compile(
+                        "|".join(re.escape(alias) for alias in _longest_first(self.aliases(ticker))),
+                        re.IGNORECASE,
+                    )
+                    self._patterns[ticker] = compiled
+        return compiled
 
-    for data_file in os.listdir(os.path.join(base_path, category)):
-        # check if data_file is a .jsonl file
-        if not data_file.endswith(".jsonl"):
-            continue
+    def mentions(self, ticker: str, *texts: str) -> bool:
+        """Whether any of the texts mentions the ticker or its company."""
+        pattern = self.pattern(ticker)
+        return any(pattern.search(text) for text in texts if text)
 
-        all_content_curr_subreddit = []
 
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
+def _longest_first(aliases: Iterable[str]) -> List[str]:
+    return sorted(aliases, key=lambda alias: (-len(alias), alias))
 
-                parsed_line = json.loads(line)
 
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
-                    continue
+company_matcher = CompanyMentionMatcher()
 
-                # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
 
-                    search_terms.append(query)
+def _top_posts_per_file(rows, files: List[str], limit_per_subreddit: int) -> List[Dict]:
+    file_order = {name: position for position, name in enumerate(files)}
 
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
+    # date -> subreddit file -> top posts, rows arrive sorted by upvotes within a file
+    selected: Dict[str, Dict[str, List[Dict]]] = {}
+    for date, data_file, post in rows:
+        posts = selected.setdefault(date, {}).setdefault(data_file, [])
+        if len(posts) < limit_per_subreddit:
+            posts.append(post)
 
-                    if not found:
-                        continue
+    all_content = []
+    for date in sorted(selected):
+        for data_file in sorted(selected[date], key=file_order.__getitem__):
+            all_content.extend(selected[date][data_file])
+    return all_content
 
-                post = {
-                    "title": parsed_line["title"],
-                    "content": parsed_line["selftext"],
-                    "url": parsed_line["url"],
-                    "upvotes": parsed_line["ups"],
-                    "posted_date": post_date,
-                }
 
-                all_content_curr_subreddit.append(post)
+def _limit_per_subreddit(files: List[str], max_limit: int) -> int:
+    if max_limit < len(files):
+        raise ValueError(
+            "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
+        )
+    return max_limit // len(files)
 
-        # sort all_content_curr_subreddit by upvote_ratio in descending order
-        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
 
-        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
+def fetch_top_from_category_range(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    start_date: Annotated[str, "First date to fetch top posts from, yyyy-mm-dd."],
+    end_date: Annotated[str, "Last date to fetch top posts from, yyyy-mm-dd."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+) -> List[Dict]:
+    """
+    Top posts of every day in [start_date, end_date], served from the reddit index in one query.
+    For each day, each subreddit contributes at most max_limit // (number of subreddits) posts,
+    ordered by upvotes; days are returned in ascending order.
+    """
+    index = get_reddit_index(data_path)
+    files = index.files(category)
+    limit_per_subreddit = _limit_per_subreddit(files, max_limit)
+
+    rows = index.query(category, start_date, end_date)
+    # if is company_news, check that the title or the content has the company's name (query) mentioned
+    if "company" in category and query:
+        rows = (
+            row
+            for row in rows
+            if company_matcher.mentions(query, row[2]["title"], row[2]["content"])
+        )
 
-    return all_content
+    return _top_posts_per_file(rows, files, limit_per_subreddit)
+
+
+def fetch_top_from_category(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    date: Annotated[str, "Date to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+):
+    return fetch_top_from_category_range(
+        category, date, date, max_limit, query, data_path=data_path
+    )
@@ -15,6 +15,15 @@ except ImportError:
 
 SavePathType = Annotated[str, "File path to save data. If None, data is not saved."]
 
+
+class ToolError(str):
+    """Text a data tool returns when a fetch failed.
+
+    The agent reads it like any other tool output, but the tool result cache
+    never stores it, so the next call tries the fetch again.
+    """
+
+
 def save_output(data: pd.DataFrame, tag: str, save_path: SavePathType = None) -> None:
     if save_path:
         data.to_csv(save_path)
@@ -33,6 +42,16 @@ def get_current_date():
     return date.today().strftime("%Y-%m-%d")
 
 
+def file_signature(path: str) -> dict:
+    """Return the absolute path, size and modification time of a data file.
+
+    Caches derived from the file keep its signature and are rebuilt once it
+    no longer matches.
+    """
+    stat = os.stat(path)
+    return {"path": os.path.abspath(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
 def decorate_all_methods(decorator):
     def class_decorator(cls):
         for attr_name, attr_value in cls.__dict__.items():
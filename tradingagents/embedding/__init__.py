@@ -9,8 +9,10 @@ from .embedding_manager import (
     GoogleEmbeddingProvider,
     OpenRouterEmbeddingProvider,
     MockEmbeddingProvider,
-    EmbeddingManager
+    EmbeddingManager,
+    EmbeddingError
 )
+from .embedding_cache import EmbeddingCache, embedding_key, get_embedding_cache
 
 __all__ = [
     "EmbeddingProvider",
@@ -18,5 +20,9 @@ __all__ = [
     "GoogleEmbeddingProvider",
     "OpenRouterEmbeddingProvider",
     "MockEmbeddingProvider",
-    "EmbeddingManager"
+    "EmbeddingManager",
+    "EmbeddingError",
+    "EmbeddingCache",
+    "embedding_key",
+    "get_embedding_cache"
 ]
\ No newline at end of file
@@ -0,0 +1,193 @@
+"""
+Content-addressed cache of text embeddings.
+
+Memory lookups and reflections embed the same situations over and over, within
+a run and across runs. Embeddings are keyed by the SHA-256 of the provider,
+model and text, and kept in an in-process LRU over a SQLite database under the
+dataflow cache directory, so other processes and later runs reuse them.
+
+Vectors are stored as float32, or as float16 to halve the disk footprint at a
+precision cost well below what similarity search can notice. Both tiers hold
+the stored precision, so a vector reads back the same from either of them.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from tradingagents.dataflows.config import get_data_cache_dir
+
+DTYPES = ("float32", "float16")
+
+# SQLite limits the number of bound parameters of one statement
+_MAX_QUERY_KEYS = 500
+
+
+def embedding_key(model_id: str, text: str) -> str:
+    """Cache key of the embedding of text by the given provider and model."""
+    digest = hashlib.sha256(model_id.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class EmbeddingCache:
+    """Two tier (LRU memory over SQLite) store of embedding vectors with hit metrics."""
+
+    def __init__(self, path: str, memory_entries: int = 4096, dtype: str = "float32"):
+        if dtype not in DTYPES:
+            raise ValueError(f"Unsupported embedding cache dtype: {dtype}")
+
+        self.path = path
+        self.memory_entries = memory_entries
+        self.dtype = dtype
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0}
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    dtype TEXT NOT NULL,
+                    vector BLOB NOT NULL
+                )
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite connections must not be shared across threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        """Return the cached embeddings of the keys found in either tier."""
+        found: Dict[str, List[float]] = {}
+        missing = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                vector = self._memory.get(key)
+                if vector is None:
+                    missing.append(key)
+                else:
+                    self._memory.move_to_end(key)
+                    found[key] = vector.tolist()
+            memory_hits = len(found)
+
+        loaded = {}
+        conn = self._connect()
+        for start in range(0, len(missing), _MAX_QUERY_KEYS):
+            chunk = missing[start:start + _MAX_QUERY_KEYS]
+            rows = conn.execute(
+                f"SELECT key, dtype, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+            for key, dtype, blob in rows:
+                loaded[key] = np.frombuffer(blob, dtype=dtype).astype(np.float32)
+
+        with self._lock:
+            for key, vector in loaded.items():
+                self._remember(key, vector)
+                found[key] = vector.tolist()
+            self._stats["memory_hits"] += memory_hits
+            self._stats["disk_hits"] += len(loaded)
+            self._stats["misses"] += len(missing) - len(loaded)
+        return found
+
+    def get(self, key: str) -> Optional[List[float]]:
+        return self.get_many([key]).get(key)
+
+    def put_many(self, model_id: str, items: Iterable[tuple]) -> List[List[float]]:
+        """Store (key, embedding) pairs computed by the given model.
+
+        Returns:
+            The embeddings at the stored precision, as later lookups return them.
+        """
+        rows = []
+        vectors = []
+        for key, embedding in items:
+            stored = np.asarray(embedding, dtype=self.dtype)
+            vectors.append((key, stored.astype(np.float32)))
+            rows.append((key, model_id, self.dtype, stored.tobytes()))
+        if not rows:
+            return []
+
+        with self._lock:
+            for key, vector in vectors:
+                self._remember(key, vector)
+            self._stats["stores"] += len(rows)
+        with self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)", rows)
+        return [vector.tolist() for _key, vector in vectors]
+
+    def _remember(self, key: str, vector: np.ndarray):
+        # Callers hold self._lock
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit and miss counts since the cache was opened, and the disk tier size."""
+        entries, size = self._connect().execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+        ).fetchone()
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (lookups - stats["misses"]) / lookups if lookups else None
+        stats["entries"] = entries
+        stats["size_bytes"] = size
+        return stats
+
+    def clear(self, model_id: Optional[str] = None):
+        with self._lock:
+            self._memory.clear()
+        with self._connect() as conn:
+            if model_id is None:
+                conn.execute("DELETE FROM embeddings")
+            else:
+                conn.execute("DELETE FROM embeddings WHERE model = ?", (model_id,))
+
+
+_caches: Dict[str, EmbeddingCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(config: Dict[str, Any]) -> Optional[EmbeddingCache]:
+    """Return the shared embedding cache for a config, or None if it is disabled."""
+    full_config = config.get("_full_config", config)
+    embedding_settings = full_config.get("embedding_settings", {})
+    if not embedding_settings.get("cache", True):
+        return None
+
+    cache_dir = get_data_cache_dir(config if config.get("data_cache_dir") else full_config)
+    path = os.path.abspath(os.path.join(cache_dir, "embedding_cache.sqlite"))
+
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            try:
+                cache = EmbeddingCache(
+                    path,
+                    memory_entries=embedding_settings.get("cache_memory_entries", 4096),
+                    dtype=embedding_settings.get("cache_dtype", "float32"),
+                )
+            except sqlite3.Error:
+                return None
+            _caches[path] = cache
+    return cache
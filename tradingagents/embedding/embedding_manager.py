@@ -3,11 +3,17 @@ Embedding provider manager for TradingAgents.
 Supports multiple embedding providers including OpenAI, OpenRouter, Google, etc.
 """
 
+import hashlib
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Union, Optional, Dict, Any
 from abc import ABC, abstractmethod
 import numpy as np
 
+from .embedding_cache import embedding_key, get_embedding_cache
+
 # Import i18n support
 try:
     from ..i18n import _
@@ -18,9 +24,16 @@ except ImportError:
         return key.format(**kwargs) if kwargs else key
 
 
+class EmbeddingError(RuntimeError):
+    """Raised instead of falling back to mock embeddings when a caller asks for strict embeddings."""
+
+
 class EmbeddingProvider(ABC):
     """Abstract base class for embedding providers."""
     
+    # Most texts sent in one get_batch_embeddings request
+    max_batch_size: int = 256
+    
     @abstractmethod
     def get_embedding(self, text: str) -> List[float]:
         """Get embedding for a text."""
@@ -35,6 +48,8 @@ class EmbeddingProvider(ABC):
 class OpenAIEmbeddingProvider(EmbeddingProvider):
     """OpenAI embedding provider."""
     
+    max_batch_size = 512
+    
     def __init__(self, model: str = "text-embedding-3-small", api_key: str = "", base_url: str = "https://api.openai.com/v1"):
         self.model = model
         self.api_key = api_key
@@ -68,6 +83,8 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
 class GoogleEmbeddingProvider(EmbeddingProvider):
     """Google Gemini embedding provider."""
     
+    max_batch_size = 100
+    
     def __init__(self, model: str = "models/embedding-001", api_key: str = ""):
         self.model = model
         self.api_key = api_key
@@ -112,20 +129,41 @@ class OpenRouterEmbeddingProvider(OpenAIEmbeddingProvider):
 
 
 class MockEmbeddingProvider(EmbeddingProvider):
-    """Mock embedding provider for testing and fallback."""
+    """Mock embedding provider for testing and fallback.
+
+    Each text gets a standard normal vector from its own Generator, seeded with
+    a BLAKE2b digest of the text, so embeddings are the same in every process
+    and run and the global NumPy random state is left alone.
+    """
+    
+    max_batch_size = 4096
     
     def __init__(self, embedding_dim: int = 1536):
         self.embedding_dim = embedding_dim
-        
+
+    @staticmethod
+    def _seed(text: str) -> int:
+        return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+    def _fill(self, text: str, out: np.ndarray) -> None:
+        np.random.default_rng(self._seed(text)).standard_normal(out=out, dtype=np.float32)
+
     def get_embedding(self, text: str) -> List[float]:
-        """Generate mock embedding based on text hash."""
-        # Simple hash-based embedding for demonstration
-        np.random.seed(hash(text) % 2**32)
-        return np.random.randn(self.embedding_dim).tolist()
+        """Generate mock embedding based on a stable digest of the text."""
+        vector = np.empty(self.embedding_dim, dtype=np.float32)
+        self._fill(text, vector)
+        return vector.tolist()
     
     def get_batch_embeddings(self, texts: List[str]) -> List[List[float]]:
-        """Generate mock embeddings for multiple texts."""
-        return [self.get_embedding(text) for text in texts]
+        """Generate mock embeddings for multiple texts into one matrix."""
+        rows = {}
+        for text in texts:
+            rows.setdefault(text, len(rows))
+        matrix = np.empty((len(rows), self.embedding_dim), dtype=np.float32)
+        for text, row in rows.items():
+            self._fill(text, matrix[row])
+        vectors = matrix.tolist()
+        return [vectors[rows[text]] for text in texts]
 
 
 class EmbeddingManager:
@@ -137,7 +175,18 @@ class EmbeddingManager:
             self.config = config["_full_config"]
         else:
             self.config = config
+        embedding_settings = self.config.get("embedding_settings", {})
+        self.batch_size = embedding_settings.get("batch_size")
+        self.max_concurrency = max(1, embedding_settings.get("max_concurrency", 4))
+        self.max_retries = embedding_settings.get("max_retries", 5)
+        # Shared by concurrent batches: after a rate limit every batch waits
+        self._backoff_until = 0.0
+        self._backoff_lock = threading.Lock()
         self.provider = self._create_provider()
+        # Mock embeddings are computed locally, caching them would gain nothing
+        self.cache = (
+            None if isinstance(self.provider, MockEmbeddingProvider) else get_embedding_cache(config)
+        )
         
     def _create_provider(self) -> EmbeddingProvider:
         """Create embedding provider based on configuration."""
@@ -192,22 +241,143 @@ class EmbeddingManager:
             else:
                 raise
     
-    def get_embedding(self, text: str) -> List[float]:
-        """Get embedding for a text."""
+    def model_id(self) -> str:
+        """Identify the provider class and model the embeddings come from."""
+        model = getattr(self.provider, "model", None)
+        if model is None:
+            model = getattr(self.provider, "embedding_dim", "")
+        return f"{type(self.provider).__name__}:{model}"
+
+    def model_digest(self) -> str:
+        """Short hash of model_id, safe to use in file and collection names."""
+        return hashlib.sha1(self.model_id().encode("utf-8")).hexdigest()[:10]
+
+    def get_embedding(self, text: str, strict: bool = False) -> List[float]:
+        """Get embedding for a text, from the embedding cache when it has been seen before.
+
+        A provider error falls back to a mock embedding, or raises EmbeddingError
+        if strict, e.g. when the embedding is going to be stored.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(embedding_key(self.model_id(), text))
+            if cached is not None:
+                return cached
         try:
-            return self.provider.get_embedding(text)
+            embedding = self.provider.get_embedding(text)
         except Exception as e:
+            if strict:
+                raise EmbeddingError(f"Embedding with {self.model_id()} failed: {e}") from e
             print(_("embedding.get_error", error=e))
             # Fallback to mock embedding
             mock_provider = MockEmbeddingProvider()
             return mock_provider.get_embedding(text)
+        return self._store([text], [embedding])[0]
     
-    def get_batch_embeddings(self, texts: List[str]) -> List[List[float]]:
-        """Get embeddings for multiple texts."""
-        try:
-            return self.provider.get_batch_embeddings(texts)
-        except Exception as e:
-            print(_("embedding.batch_error", error=e))
-            # Fallback to mock embeddings
-            mock_provider = MockEmbeddingProvider()
-            return mock_provider.get_batch_embeddings(texts)
\ No newline at end of file
+    def get_batch_embeddings(self, texts: List[str], strict: bool = False) -> List[List[float]]:
+        """Get embeddings for multiple texts.
+
+        Cached embeddings are reused and each distinct uncached text is
+        embedded once. Those are split into provider sized batches and up to
+        max_concurrency batches are requested at a time. Batches that hit a
+        rate limit or another transient error (timeout, connection or server
+        error) are retried with exponential backoff; a batch that still fails
+        falls back to mock embeddings, or raises EmbeddingError if strict.
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        if self.cache is None:
+            return self._embed_uncached(texts, strict)
+
+        model_id = self.model_id()
+        keys = [embedding_key(model_id, text) for text in texts]
+        found = self.cache.get_many(keys)
+        missing = list(dict.fromkeys(text for text, key in zip(texts, keys) if key not in found))
+        if missing:
+            for text, embedding in zip(missing, self._embed_uncached(missing, strict)):
+                found[embedding_key(model_id, text)] = embedding
+        return [found[key] for key in keys]
+
+    def _embed_uncached(self, texts: List[str], strict: bool) -> List[List[float]]:
+        size = self.batch_size or self.provider.max_batch_size
+        batches = [texts[i:i + size] for i in range(0, len(texts), size)]
+        if len(batches) == 1:
+            return self._embed_batch(batches[0], strict)
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches))) as executor:
+            return [
+                embedding
+                for batch in executor.map(lambda batch: self._embed_batch(batch, strict), batches)
+                for embedding in batch
+            ]
+
+    def _embed_batch(self, texts: List[str], strict: bool) -> List[List[float]]:
+        delay = 1.0
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_backoff()
+            try:
+                embeddings = self.provider.get_batch_embeddings(texts)
+            except Exception as e:
+                if attempt < self.max_retries and _is_transient(e):
+                    self._back_off(_retry_after(e) or delay)
+                    delay = min(delay * 2, 60.0)
+                    continue
+                if strict:
+                    raise EmbeddingError(f"Embedding with {self.model_id()} failed: {e}") from e
+                print(_("embedding.batch_error", error=e))
+                # Fallback to mock embeddings
+                mock_provider = MockEmbeddingProvider()
+                return mock_provider.get_batch_embeddings(texts)
+            return self._store(texts, embeddings)
+
+    def _store(self, texts: List[str], embeddings: List[List[float]]) -> List[List[float]]:
+        # Only real provider output is cached, never the mock fallback
+        if self.cache is None:
+            return embeddings
+        model_id = self.model_id()
+        return self.cache.put_many(
+            model_id,
+            ((embedding_key(model_id, text), embedding) for text, embedding in zip(texts, embeddings)),
+        )
+
+    def _wait_for_backoff(self):
+        wait = self._backoff_until - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
+    def _back_off(self, seconds: float):
+        with self._backoff_lock:
+            self._backoff_until = max(self._backoff_until, time.monotonic() + seconds)
+
+
+# Provider client errors worth retrying (OpenAI, Google API core)
+_TRANSIENT_ERRORS = (
+    "RateLimitError",
+    "ResourceExhausted",
+    "APIConnectionError",
+    "APITimeoutError",
+    "InternalServerError",
+    "ServiceUnavailable",
+    "DeadlineExceeded",
+)
+
+
+def _is_transient(error: Exception) -> bool:
+    status = getattr(error, "status_code", None) or getattr(
+        getattr(error, "response", None), "status_code", None
+    )
+    return (
+        status == 429
+        or (isinstance(status, int) and status >= 500)
+        or isinstance(error, (ConnectionError, TimeoutError))
+        or type(error).__name__ in _TRANSIENT_ERRORS
+        or "rate limit" in str(error).lower()
+    )
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
@@ -1,8 +1,24 @@
 # TradingAgents/graph/reflection.py
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 from langchain_openai import ChatOpenAI
 
+# memory name -> (component label, reader of the reflected analysis/decision)
+REFLECTION_COMPONENTS = {
+    "bull": ("BULL", lambda state: state["investment_debate_state"]["bull_history"]),
+    "bear": ("BEAR", lambda state: state["investment_debate_state"]["bear_history"]),
+    "trader": ("TRADER", lambda state: state["trader_investment_plan"]),
+    "invest_judge": (
+        "INVEST JUDGE",
+        lambda state: state["investment_debate_state"]["judge_decision"],
+    ),
+    "risk_manager": (
+        "RISK JUDGE",
+        lambda state: state["risk_debate_state"]["judge_decision"],
+    ),
+}
+
 
 class Reflector:
     """Handles reflection on decisions and updating memory."""
@@ -70,6 +86,38 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
         result = self.quick_thinking_llm.invoke(messages).content
         return result
 
+    def reflect_all(self, current_state, returns_losses, memories: Dict[str, Any]):
+        """Reflect on every component with a memory and update those memories.
+
+        The situation is built once, the reflections run concurrently and the
+        situation, which is the same for every memory, is embedded only once.
+        It is embedded first, with retries, so an embedding failure raises
+        EmbeddingError before any reflection has been paid for.
+
+        Args:
+            memories: memory per component name of REFLECTION_COMPONENTS
+        """
+        names = [name for name in REFLECTION_COMPONENTS if name in memories]
+        if not names:
+            return
+        situation = self._extract_current_situation(current_state)
+        # Strict: a mock fallback vector must not be stored as a lesson
+        embedding = memories[names[0]].embedding_manager.get_batch_embeddings(
+            [situation], strict=True
+        )[0]
+
+        def reflect(name):
+            component_type, read_report = REFLECTION_COMPONENTS[name]
+            return self._reflect_on_component(
+                component_type, read_report(current_state), situation, returns_losses
+            )
+
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            results = list(executor.map(reflect, names))
+
+        for name, result in zip(names, results):
+            memories[name].add_situations([(situation, result)], embeddings=[embedding])
+
     def reflect_bull_researcher(self, current_state, returns_losses, bull_memory):
         """Reflect on bull researcher's analysis and update memory."""
         situation = self._extract_current_situation(current_state)
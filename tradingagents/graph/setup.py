@@ -1,16 +1,27 @@
 # TradingAgents/graph/setup.py
 
 from typing import Dict, Any
+from langchain_core.runnables import RunnableLambda
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph, START
 from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
+from tradingagents.config_manager import PARALLEL_ANALYSTS_DEFAULT
 from tradingagents.agents.utils.agent_states import AgentState
 from tradingagents.agents.utils.agent_utils import Toolkit
+from tradingagents.agents.utils.memory import create_situation_embedder
 
 from .conditional_logic import ConditionalLogic
 
+# State field each analyst writes its report to
+ANALYST_REPORTS = {
+    "market": "market_report",
+    "social": "sentiment_report",
+    "news": "news_report",
+    "fundamentals": "fundamentals_report",
+}
+
 
 class GraphSetup:
     """Handles the setup and configuration of the agent graph."""
@@ -41,7 +52,9 @@ class GraphSetup:
         self.conditional_logic = conditional_logic
 
     def setup_graph(
-        self, selected_analysts=["market", "social", "news", "fundamentals"]
+        self,
+        selected_analysts=["market", "social", "news", "fundamentals"],
+        parallel_analysts=PARALLEL_ANALYSTS_DEFAULT,
     ):
         """Set up and compile the agent workflow graph.
 
@@ -51,6 +64,8 @@ class GraphSetup:
                 - "social": Social media analyst
                 - "news": News analyst
                 - "fundamentals": Fundamentals analyst
+            parallel_analysts (bool): Run the analysts concurrently, each in its own
+                subgraph, instead of one after another
         """
         if len(selected_analysts) == 0:
             raise ValueError("Trading Agents Graph Setup Error: no analysts selected!")
@@ -111,15 +126,10 @@ class GraphSetup:
         # Create workflow
         workflow = StateGraph(AgentState)
 
-        # Add analyst nodes to the graph
-        for analyst_type, node in analyst_nodes.items():
-            workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
-            workflow.add_node(
-                f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
-            )
-            workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
-
         # Add other nodes
+        workflow.add_node(
+            "Situation Embedding", create_situation_embedder(self.bull_memory)
+        )
         workflow.add_node("Bull Researcher", bull_researcher_node)
         workflow.add_node("Bear Researcher", bear_researcher_node)
         workflow.add_node("Research Manager", research_manager_node)
@@ -129,33 +139,47 @@ class GraphSetup:
         workflow.add_node("Safe Analyst", safe_analyst)
         workflow.add_node("Risk Judge", risk_manager_node)
 
-        # Define edges
-        # Start with the first analyst
-        first_analyst = selected_analysts[0]
-        workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
-
-        # Connect analysts in sequence
-        for i, analyst_type in enumerate(selected_analysts):
-            current_analyst = f"{analyst_type.capitalize()} Analyst"
-            current_tools = f"tools_{analyst_type}"
-            current_clear = f"Msg Clear {analyst_type.capitalize()}"
-
-            # Add conditional edges for current analyst
-            workflow.add_conditional_edges(
-                current_analyst,
-                getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
-                [current_tools, current_clear],
+        if parallel_analysts:
+            self._add_parallel_analysts(
+                workflow, selected_analysts, analyst_nodes, tool_nodes
             )
-            workflow.add_edge(current_tools, current_analyst)
+        else:
+            # Add analyst nodes to the graph
+            for analyst_type, node in analyst_nodes.items():
+                workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
+                workflow.add_node(
+                    f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
+                )
+                workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
 
-            # Connect to next analyst or to Bull Researcher if this is the last analyst
-            if i < len(selected_analysts) - 1:
-                next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
-                workflow.add_edge(current_clear, next_analyst)
-            else:
-                workflow.add_edge(current_clear, "Bull Researcher")
+            # Define edges
+            # Start with the first analyst
+            first_analyst = selected_analysts[0]
+            workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
+
+            # Connect analysts in sequence
+            for i, analyst_type in enumerate(selected_analysts):
+                current_analyst = f"{analyst_type.capitalize()} Analyst"
+                current_tools = f"tools_{analyst_type}"
+                current_clear = f"Msg Clear {analyst_type.capitalize()}"
+
+                # Add conditional edges for current analyst
+                workflow.add_conditional_edges(
+                    current_analyst,
+                    getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+                    [current_tools, current_clear],
+                )
+                workflow.add_edge(current_tools, current_analyst)
+
+                # Connect to next analyst, or to the researchers if this is the last analyst
+                if i < len(selected_analysts) - 1:
+                    next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
+                    workflow.add_edge(current_clear, next_analyst)
+                else:
+                    workflow.add_edge(current_clear, "Situation Embedding")
 
         # Add remaining edges
+        workflow.add_edge("Situation Embedding", "Bull Researcher")
         workflow.add_conditional_edges(
             "Bull Researcher",
             self.conditional_logic.should_continue_debate,
@@ -203,3 +227,61 @@ class GraphSetup:
 
         # Compile and return
         return workflow.compile()
+
+    def _add_parallel_analysts(
+        self, workflow, selected_analysts, analyst_nodes, tool_nodes
+    ):
+        """Fan the analysts out from START and join them before the researchers.
+
+        Each analyst runs its tool-calling loop in its own compiled subgraph, so the
+        analysts keep separate message histories and only hand their report (and
+        final message) back to the main graph.
+        """
+        analyst_names = []
+        for analyst_type in selected_analysts:
+            name = f"{analyst_type.capitalize()} Analyst"
+            subgraph = self._analyst_subgraph(
+                analyst_type, analyst_nodes[analyst_type], tool_nodes[analyst_type]
+            )
+            workflow.add_node(
+                name, self._run_analyst_subgraph(subgraph, ANALYST_REPORTS[analyst_type])
+            )
+            workflow.add_edge(START, name)
+            analyst_names.append(name)
+
+        # Waits for every analyst, then clears their messages like the sequential flow does
+        workflow.add_node("Msg Clear Analysts", create_msg_delete())
+        workflow.add_edge(analyst_names, "Msg Clear Analysts")
+        workflow.add_edge("Msg Clear Analysts", "Situation Embedding")
+
+    def _analyst_subgraph(self, analyst_type, analyst_node, tool_node):
+        name = f"{analyst_type.capitalize()} Analyst"
+        tools = f"tools_{analyst_type}"
+
+        subgraph = StateGraph(AgentState)
+        subgraph.add_node(name, analyst_node)
+        subgraph.add_node(tools, tool_node)
+        subgraph.add_edge(START, name)
+        subgraph.add_conditional_edges(
+            name,
+            getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+            {tools: tools, f"Msg Clear {analyst_type.capitalize()}": END},
+        )
+        subgraph.add_edge(tools, name)
+        return subgraph.compile()
+
+    @staticmethod
+    def _run_analyst_subgraph(subgraph, report_key):
+        def analyst_result(final_state):
+            return {
+                "messages": final_state["messages"][-1:],
+                report_key: final_state[report_key],
+            }
+
+        def run_analyst(state, config):
+            return analyst_result(subgraph.invoke(state, config))
+
+        async def arun_analyst(state, config):
+            return analyst_result(await subgraph.ainvoke(state, config))
+
+        return RunnableLambda(run_analyst, afunc=arun_analyst)
@@ -1,7 +1,103 @@
 # TradingAgents/graph/signal_processing.py
 
+import re
+import threading
+from collections import Counter
+from typing import NamedTuple, Optional
+
 from langchain_openai import ChatOpenAI
 
+_DECISIONS = {
+    "buy": "BUY",
+    "sell": "SELL",
+    "hold": "HOLD",
+    "买入": "BUY",
+    "卖出": "SELL",
+    "持有": "HOLD",
+}
+
+_DECISION = r"(buy|sell|hold|买入|卖出|持有)"
+# A decision word that is not part of a longer word or of a "Buy/Hold/Sell" style list
+_END = r"(?![A-Za-z])(?!\s*(?:/|、|,|，|或|or\b))"
+_QUOTES = r"[*_`\"'“”「」\s]*"
+
+# "FINAL TRANSACTION PROPOSAL: **BUY**" as requested by the analyst and trader prompts
+_MARKER_PATTERN = re.compile(
+    r"(?:FINAL\s+TRANSACTION\s+PROPOSAL|最终交易提案|最终交易建议)\s*[*_]*\s*[:：]?"
+    + _QUOTES + _DECISION + _END,
+    re.IGNORECASE,
+)
+# "Recommendation: Sell", "**Final Decision**: **Hold**", "建议：买入"
+_LABEL_PATTERN = re.compile(
+    r"(?:recommendation|decision|verdict|action|建议|决定|决策|结论)\s*[*_]*\s*[:：\-–—]"
+    + _QUOTES + _DECISION + _END,
+    re.IGNORECASE,
+)
+# "**Sell**"
+_EMPHASIS_PATTERN = re.compile(r"\*\*\s*" + _DECISION + r"\s*\*\*", re.IGNORECASE)
+# A negation shortly before a decision word in the same clause, as in "do not **Buy**"
+_NEGATION_PATTERN = re.compile(
+    r"(?:\b(?:not|never|no|avoid|against)\b|n['’]t|不要|不应|不宜|不|别|避免|无需)[^.,;:!?。，、；：！？\n]{0,15}$",
+    re.IGNORECASE,
+)
+
+
+class SignalDecision(NamedTuple):
+    """A decision extracted from a trading signal and the path that produced it."""
+
+    decision: str
+    # "marker", "label", "emphasis" or "llm"
+    source: str
+
+
+def _statements(pattern, text, taken=()):
+    """(start, end, decision, negated) of the matches not inside an already taken span."""
+    found = []
+    for match in pattern.finditer(text):
+        if any(start <= match.start() < end for start, end in taken):
+            continue
+        negated = bool(_NEGATION_PATTERN.search(text[max(0, match.start() - 20):match.start()]))
+        found.append((match.start(), match.end(), _DECISIONS[match.group(1).lower()], negated))
+    return found
+
+
+def extract_decision(full_signal: str) -> Optional[SignalDecision]:
+    """
+    Extract BUY, SELL or HOLD from an English or Chinese signal without an LLM.
+
+    The explicit "FINAL TRANSACTION PROPOSAL" marker decides when no later
+    labelled statement ("Recommendation: Sell") or bold decision word disagrees
+    with its last occurrence; the risk judge may quote the trader's marker and
+    then overrule it. Without a marker the labelled statements and bold words
+    must all agree, and bold words alone decide only when there are several.
+    A negated decision ("do not **Buy**") always leaves the signal to the LLM.
+
+    Returns:
+        The decision and its source, or None if the signal is ambiguous.
+    """
+    text = full_signal or ""
+
+    markers = _statements(_MARKER_PATTERN, text)
+    labels = _statements(_LABEL_PATTERN, text, [m[:2] for m in markers])
+    emphasis = _statements(_EMPHASIS_PATTERN, text, [m[:2] for m in markers + labels])
+    if any(negated for *_span, negated in markers + labels + emphasis):
+        return None
+
+    if markers:
+        last_start, _end, decision, _negated = markers[-1]
+        later = {d for start, _e, d, _n in labels + emphasis if start > last_start}
+        return SignalDecision(decision, "marker") if later <= {decision} else None
+
+    decisions = {d for *_span, d, _n in labels + emphasis}
+    if len(decisions) != 1:
+        return None
+    if labels:
+        return SignalDecision(decisions.pop(), "label")
+    if len(emphasis) > 1:
+        return SignalDecision(decisions.pop(), "emphasis")
+    # A lone bold word is too weak to act on
+    return None
+
 
 class SignalProcessor:
     """Processes trading signals to extract actionable decisions."""
@@ -9,6 +105,9 @@ class SignalProcessor:
     def __init__(self, quick_thinking_llm: ChatOpenAI):
         """Initialize with an LLM for processing."""
         self.quick_thinking_llm = quick_thinking_llm
+        # How many signals each extraction path resolved
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
 
     def process_signal(self, full_signal: str) -> str:
         """
@@ -20,12 +119,39 @@ class SignalProcessor:
         Returns:
             Extracted decision (BUY, SELL, or HOLD)
         """
-        messages = [
+        return self.extract(full_signal).decision
+
+    async def aprocess_signal(self, full_signal: str) -> str:
+        """Async variant of process_signal."""
+        return (await self.aextract(full_signal)).decision
+
+    def extract(self, full_signal: str) -> SignalDecision:
+        """Extract the decision locally, asking the LLM only if the signal is ambiguous."""
+        result = extract_decision(full_signal)
+        if result is None:
+            content = self.quick_thinking_llm.invoke(self._messages(full_signal)).content
+            result = SignalDecision(content, "llm")
+        return self._count(result)
+
+    async def aextract(self, full_signal: str) -> SignalDecision:
+        """Async variant of extract."""
+        result = extract_decision(full_signal)
+        if result is None:
+            response = await self.quick_thinking_llm.ainvoke(self._messages(full_signal))
+            result = SignalDecision(response.content, "llm")
+        return self._count(result)
+
+    def _count(self, result: SignalDecision) -> SignalDecision:
+        with self._stats_lock:
+            self.stats[result.source] += 1
+        return result
+
+    @staticmethod
+    def _messages(full_signal: str):
+        return [
             (
                 "system",
                 "You are an efficient assistant designed to analyze paragraphs or financial reports provided by a group of analysts. Your task is to extract the investment decision: SELL, BUY, or HOLD. Provide only the extracted decision (SELL, BUY, or HOLD) as your output, without adding any additional text or information.",
             ),
             ("human", full_signal),
         ]
-
-        return self.quick_thinking_llm.invoke(messages).content
@@ -3,8 +3,12 @@
 import os
 from pathlib import Path
 import json
+import itertools
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import date
-from typing import Dict, Any, Tuple, List, Optional
+from typing import Dict, Any, Tuple, List, Optional, Iterator, NamedTuple, Sequence, Union
 
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
@@ -13,14 +17,19 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
+from tradingagents.config_manager import PARALLEL_ANALYSTS_DEFAULT
 from tradingagents.default_config import DEFAULT_CONFIG
-from tradingagents.agents.utils.memory import FinancialSituationMemory
+from tradingagents.agents.utils.memory import create_memory
 from tradingagents.agents.utils.agent_states import (
     AgentState,
     InvestDebateState,
     RiskDebateState,
 )
-from tradingagents.dataflows.interface import set_config
+from tradingagents.dataflows.interface import DATA_DIR, set_config
+from tradingagents.dataflows.fundamentals_store import STATEMENT_FILES, get_fundamentals_store
+from tradingagents.dataflows.online_price_cache import get_online_price_cache
+from tradingagents.dataflows.price_store import get_price_store
+from tradingagents.utils.llm_cache import get_llm_cache
 
 from .conditional_logic import ConditionalLogic
 from .setup import GraphSetup
@@ -29,6 +38,16 @@ from .reflection import Reflector
 from .signal_processing import SignalProcessor
 
 
+class BatchResult(NamedTuple):
+    """Outcome of one (ticker, date) job of TradingAgentsGraph.propagate_batch."""
+
+    ticker: str
+    trade_date: str
+    final_state: Optional[Dict[str, Any]]
+    decision: Optional[str]
+    error: Optional[Exception]
+
+
 class TradingAgentsGraph:
     """Main class that orchestrates the trading agents framework."""
 
@@ -47,6 +66,7 @@ class TradingAgentsGraph:
         """
         self.debug = debug
         self.config = config or DEFAULT_CONFIG
+        self.selected_analysts = list(selected_analysts)
 
         # Update the interface's config
         set_config(self.config)
@@ -68,11 +88,15 @@ class TradingAgentsGraph:
         quick_think_model = config_manager.get_model_config(provider_key, "quick_think")
         base_url = config_manager.get_base_url(provider_key)
         api_key = config_manager.get_api_key(provider_key)
+        # Identical prompts to the same model are answered from disk
+        llm_cache = get_llm_cache(self.config)
         
         if provider_key in ["openai", "ollama", "openrouter", "kimi (moonshot)", "zhipu ai", "deepseek"]:
             llm_kwargs = {"model": deep_think_model, "base_url": base_url}
             if api_key:
                 llm_kwargs["api_key"] = api_key
+            if llm_cache is not None:
+                llm_kwargs["cache"] = llm_cache
             self.deep_thinking_llm = ChatOpenAI(**llm_kwargs)
             
             llm_kwargs["model"] = quick_think_model
@@ -81,6 +105,8 @@ class TradingAgentsGraph:
             llm_kwargs = {"model": deep_think_model, "base_url": base_url}
             if api_key:
                 llm_kwargs["api_key"] = api_key
+            if llm_cache is not None:
+                llm_kwargs["cache"] = llm_cache
             self.deep_thinking_llm = ChatAnthropic(**llm_kwargs)
             
             llm_kwargs["model"] = quick_think_model
@@ -89,6 +115,8 @@ class TradingAgentsGraph:
             llm_kwargs = {"model": deep_think_model}
             if api_key:
                 llm_kwargs["api_key"] = api_key
+            if llm_cache is not None:
+                llm_kwargs["cache"] = llm_cache
             self.deep_thinking_llm = ChatGoogleGenerativeAI(**llm_kwargs)
             
             llm_kwargs["model"] = quick_think_model
@@ -99,11 +127,11 @@ class TradingAgentsGraph:
         self.toolkit = Toolkit(config=self.config)
 
         # Initialize memories
-        self.bull_memory = FinancialSituationMemory("bull_memory", self.config)
-        self.bear_memory = FinancialSituationMemory("bear_memory", self.config)
-        self.trader_memory = FinancialSituationMemory("trader_memory", self.config)
-        self.invest_judge_memory = FinancialSituationMemory("invest_judge_memory", self.config)
-        self.risk_manager_memory = FinancialSituationMemory("risk_manager_memory", self.config)
+        self.bull_memory = create_memory("bull_memory", self.config)
+        self.bear_memory = create_memory("bear_memory", self.config)
+        self.trader_memory = create_memory("trader_memory", self.config)
+        self.invest_judge_memory = create_memory("invest_judge_memory", self.config)
+        self.risk_manager_memory = create_memory("risk_manager_memory", self.config)
 
         # Create tool nodes
         self.tool_nodes = self._create_tool_nodes()
@@ -130,10 +158,13 @@ class TradingAgentsGraph:
         # State tracking
         self.curr_state = None
         self.ticker = None
-        self.log_states_dict = {}  # date to full state dict
+        self.log_states_dict = {}  # ticker to {date: full state dict}
+        self._log_lock = threading.Lock()
 
         # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.graph = self.graph_setup.setup_graph(
+            selected_analysts, self.config.get("parallel_analysts", PARALLEL_ANALYSTS_DEFAULT)
+        )
 
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
         """Create tool nodes for different data sources."""
@@ -143,9 +174,11 @@ class TradingAgentsGraph:
                     # online tools
                     self.toolkit.get_YFin_data_online,
                     self.toolkit.get_stockstats_indicators_report_online,
+                    self.toolkit.get_stockstats_indicators_batch_report_online,
                     # offline tools
                     self.toolkit.get_YFin_data,
                     self.toolkit.get_stockstats_indicators_report,
+                    self.toolkit.get_stockstats_indicators_batch_report,
                 ]
             ),
             "social": ToolNode(
@@ -173,6 +206,7 @@ class TradingAgentsGraph:
                     # offline tools
                     self.toolkit.get_finnhub_company_insider_sentiment,
                     self.toolkit.get_finnhub_company_insider_transactions,
+                    self.toolkit.get_simfin_fundamentals,
                     self.toolkit.get_simfin_balance_sheet,
                     self.toolkit.get_simfin_cashflow,
                     self.toolkit.get_simfin_income_stmt,
@@ -185,6 +219,18 @@ class TradingAgentsGraph:
 
         self.ticker = company_name
 
+        final_state = self._run_graph(company_name, trade_date)
+
+        # Store current state for reflection
+        self.curr_state = final_state
+
+        # Log state
+        self._log_state(trade_date, final_state)
+
+        # Return decision and processed signal
+        return final_state, self.process_signal(final_state["final_trade_decision"])
+
+    def _run_graph(self, company_name, trade_date):
         # Initialize state
         init_agent_state = self.propagator.create_initial_state(
             company_name, trade_date
@@ -201,10 +247,149 @@ class TradingAgentsGraph:
                     chunk["messages"][-1].pretty_print()
                     trace.append(chunk)
 
+            return trace[-1]
+
+        # Standard mode without tracing
+        return self.graph.invoke(init_agent_state, **args)
+
+    def propagate_batch(
+        self,
+        tickers: Union[str, Sequence[str]],
+        dates: Union[str, Sequence[str]],
+        max_concurrency: int = 4,
+        processes: bool = False,
+    ) -> Iterator[BatchResult]:
+        """Run the graph for every (ticker, date) pair, up to max_concurrency at a time.
+
+        By default all jobs run on threads and share this instance's LLM clients,
+        data caches and compiled graph. With processes=True they are sharded by
+        ticker and date range across max_concurrency worker processes instead,
+        so the CPU bound data tools do not contend for one GIL (see
+        _propagate_batch_processes).
+        Results are yielded as each job finishes, so the order is not the input
+        order; a failed job is yielded with its exception instead of raising.
+        The per-run states are logged as usual but curr_state is left untouched,
+        pass the yielded state to reflect_and_remember explicitly.
+        """
+        tickers = [tickers] if isinstance(tickers, str) else list(tickers)
+        dates = [dates] if isinstance(dates, str) else list(dates)
+
+        if processes:
+            yield from self._propagate_batch_processes(tickers, dates, max_concurrency)
+            return
+
+        def run(company_name, trade_date):
+            final_state = self._run_graph(company_name, trade_date)
+            self._log_state(trade_date, final_state)
+            decision = self.process_signal(final_state["final_trade_decision"])
+            return final_state, decision
+
+        executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency))
+        try:
+            futures = {
+                executor.submit(run, ticker, trade_date): (ticker, trade_date)
+                for ticker, trade_date in itertools.product(tickers, dates)
+            }
+            yield from self._collect_batch(futures)
+        finally:
+            # Stop queued jobs if the caller stops consuming the results early
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _propagate_batch_processes(
+        self, tickers: List[str], dates: List[str], max_workers: int
+    ) -> Iterator[BatchResult]:
+        """Process pool flavour of propagate_batch.
+
+        Each worker process builds its own graph of this class once, with the
+        same analysts and config, and warms the data caches of the tickers it
+        is given. The jobs are split into (ticker, date range) chunks so every
+        worker gets work even when a batch has fewer tickers than workers,
+        and a ticker is only split across workers when there are not enough
+        tickers to go around, so its price series and statements stay hot
+        across its dates. Workers use spawn rather than fork, so a calling
+        script must guard its entry point with ``if __name__ == "__main__"``.
+
+        Workers open the agent memories from the config like this instance
+        does. With ``memory_persistent`` (the default) every backend keeps its
+        lessons in the shared situation log, which each process reloads when
+        another one appends, so workers see this instance's lessons and each
+        other's reflections. With non-persistent memories every worker starts
+        with empty memories of its own.
+        """
+        shards = _shard_batch_jobs(list(dict.fromkeys(tickers)), dates, max_workers)
+
+        context = multiprocessing.get_context("spawn")
+        executors = [
+            ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=context,
+                initializer=_init_batch_worker,
+                initargs=(
+                    type(self),
+                    self.selected_analysts,
+                    self.debug,
+                    self.config,
+                    list(dict.fromkeys(ticker for ticker, _date in shard)),
+                ),
+            )
+            for shard in shards
+        ]
+        try:
+            futures = {}
+            for executor, shard in zip(executors, shards):
+                for ticker, trade_date in shard:
+                    future = executor.submit(_run_batch_job, ticker, trade_date)
+                    futures[future] = (ticker, trade_date)
+
+            for result in self._collect_batch(futures):
+                if result.final_state is not None:
+                    # The worker wrote the log file; keep the in-memory view complete
+                    with self._log_lock:
+                        self.log_states_dict.setdefault(result.ticker, {})[
+                            str(result.trade_date)
+                        ] = self._log_entry(result.final_state)
+                yield result
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _collect_batch(futures) -> Iterator[BatchResult]:
+        for future in as_completed(futures):
+            ticker, trade_date = futures[future]
+            try:
+                final_state, decision = future.result()
+            except Exception as e:
+                yield BatchResult(ticker, trade_date, None, None, e)
+            else:
+                yield BatchResult(ticker, trade_date, final_state, decision, None)
+
+    async def apropagate(self, company_name, trade_date):
+        """Async variant of propagate: agent nodes await their model calls, so many
+        runs can share one event loop."""
+
+        self.ticker = company_name
+
+        # Initialize state
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date
+        )
+        args = self.propagator.get_graph_args()
+
+        if self.debug:
+            # Debug mode with tracing
+            trace = []
+            async for chunk in self.graph.astream(init_agent_state, **args):
+                if len(chunk["messages"]) == 0:
+                    pass
+                else:
+                    chunk["messages"][-1].pretty_print()
+                    trace.append(chunk)
+
             final_state = trace[-1]
         else:
             # Standard mode without tracing
-            final_state = self.graph.invoke(init_agent_state, **args)
+            final_state = await self.graph.ainvoke(init_agent_state, **args)
 
         # Store current state for reflection
         self.curr_state = final_state
@@ -213,11 +398,31 @@ class TradingAgentsGraph:
         self._log_state(trade_date, final_state)
 
         # Return decision and processed signal
-        return final_state, self.process_signal(final_state["final_trade_decision"])
+        return final_state, await self.aprocess_signal(final_state["final_trade_decision"])
 
     def _log_state(self, trade_date, final_state):
         """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        ticker = final_state["company_of_interest"]
+        entry = self._log_entry(final_state)
+
+        with self._log_lock:
+            ticker_states = self.log_states_dict.setdefault(ticker, {})
+            ticker_states[str(trade_date)] = entry
+
+            # Save to file
+            directory = Path(f"eval_results/{ticker}/TradingAgentsStrategy_logs/")
+            directory.mkdir(parents=True, exist_ok=True)
+
+            # Write then rename so a concurrent reader never sees a partial file
+            path = directory / f"full_states_log_{trade_date}.json"
+            tmp_path = directory / f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(ticker_states, f, indent=4)
+            os.replace(tmp_path, path)
+
+    @staticmethod
+    def _log_entry(final_state) -> Dict[str, Any]:
+        return {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -247,34 +452,100 @@ class TradingAgentsGraph:
             "final_trade_decision": final_state["final_trade_decision"],
         }
 
-        # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
-        directory.mkdir(parents=True, exist_ok=True)
+    def reflect_and_remember(self, returns_losses, final_state=None):
+        """Reflect on decisions and update memory based on returns.
 
-        with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
-            "w",
-        ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
-
-    def reflect_and_remember(self, returns_losses):
-        """Reflect on decisions and update memory based on returns."""
-        self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
-        )
-        self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
-        )
-        self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
-        )
-        self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
-        )
-        self.reflector.reflect_risk_manager(
-            self.curr_state, returns_losses, self.risk_manager_memory
+        Uses the state of the last propagate call unless final_state is given.
+        """
+        state = final_state if final_state is not None else self.curr_state
+        self.reflector.reflect_all(
+            state,
+            returns_losses,
+            {
+                "bull": self.bull_memory,
+                "bear": self.bear_memory,
+                "trader": self.trader_memory,
+                "invest_judge": self.invest_judge_memory,
+                "risk_manager": self.risk_manager_memory,
+            },
         )
 
     def process_signal(self, full_signal):
         """Process a signal to extract the core decision."""
         return self.signal_processor.process_signal(full_signal)
+
+    async def aprocess_signal(self, full_signal):
+        """Async variant of process_signal."""
+        return await self.signal_processor.aprocess_signal(full_signal)
+
+
+# Graph of a propagate_batch worker process, built once by _init_batch_worker
+_batch_worker_graph: Optional[TradingAgentsGraph] = None
+
+
+def _shard_batch_jobs(
+    tickers: Sequence[str], dates: Sequence[str], worker_count: int
+) -> List[List[Tuple[str, str]]]:
+    """Split the (ticker, date) jobs of a batch into one list per worker.
+
+    Each ticker's dates are cut into as few contiguous chunks as it takes for
+    every worker to get one, and the chunks are dealt out largest first to the
+    least loaded worker. Workers left without a job are dropped.
+    """
+    if not tickers or not dates:
+        return []
+    worker_count = max(1, min(worker_count, len(tickers) * len(dates)))
+    chunks_per_ticker = min(len(dates), -(-worker_count // len(tickers)))
+
+    chunks = []
+    for ticker in tickers:
+        for i in range(chunks_per_ticker):
+            start = i * len(dates) // chunks_per_ticker
+            end = (i + 1) * len(dates) // chunks_per_ticker
+            chunks.append([(ticker, trade_date) for trade_date in dates[start:end]])
+
+    shards: List[List[Tuple[str, str]]] = [[] for _ in range(worker_count)]
+    for chunk in sorted(chunks, key=len, reverse=True):
+        min(shards, key=len).extend(chunk)
+    return [shard for shard in shards if shard]
+
+
+def _init_batch_worker(graph_class, selected_analysts, debug, config, tickers):
+    global _batch_worker_graph
+    _batch_worker_graph = graph_class(selected_analysts, debug, config)
+    _warm_data_caches(_batch_worker_graph, tickers)
+
+
+def _run_batch_job(company_name, trade_date):
+    graph = _batch_worker_graph
+    final_state = graph._run_graph(company_name, trade_date)
+    graph._log_state(trade_date, final_state)
+    return final_state, graph.process_signal(final_state["final_trade_decision"])
+
+
+def _warm_data_caches(graph: TradingAgentsGraph, tickers: Sequence[str]):
+    """Load the price series and statement tables a worker's tickers will query."""
+    config = graph.config
+    # The same data folder the dataflow tools read from
+    data_dir = DATA_DIR
+    try:
+        if "market" in graph.selected_analysts:
+            if config.get("online_tools"):
+                cache = get_online_price_cache()
+                for ticker in tickers:
+                    cache.load(ticker)
+            else:
+                store = get_price_store(os.path.join(data_dir, "market_data", "price_data"))
+                for ticker in tickers:
+                    if os.path.exists(store.source_path(ticker)):
+                        store.load(ticker)
+
+        if "fundamentals" in graph.selected_analysts and not config.get("online_tools"):
+            store = get_fundamentals_store(data_dir)
+            for statement in STATEMENT_FILES:
+                for freq in ("annual", "quarterly"):
+                    if os.path.exists(store.source_path(statement, freq)):
+                        store.table(statement, freq)
+    except Exception:
+        # Warming is best effort; the tools load whatever is missing on first use
+        pass
@@ -0,0 +1,226 @@
+"""
+Content-addressed cache of LLM responses.
+
+Every chat model call is keyed by LangChain's ``llm_string`` (provider class,
+model and call parameters, including any bound tool schemas) together with
+the serialized prompt messages, hashed with SHA-256. Responses are stored in a
+SQLite database under the dataflow cache directory with a time-to-live and a
+size budget; the least recently used entries are evicted once the budget is
+exceeded.
+
+Modes:
+    read_through  serve hits from the cache, call the model and store on a miss
+    record_only   always call the model and store the response
+    replay_only   serve hits only, a miss raises LLMCacheMiss instead of calling
+    off           no caching (the default)
+
+Replaying responses makes reruns of the same prompts return the same answers,
+so it is opt-in: the agents' output varies from run to run otherwise.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+from tradingagents.dataflows.config import get_data_cache_dir
+
+READ_THROUGH = "read_through"
+RECORD_ONLY = "record_only"
+REPLAY_ONLY = "replay_only"
+OFF = "off"
+
+MODES = (READ_THROUGH, RECORD_ONLY, REPLAY_ONLY, OFF)
+
+# Expired and over-budget entries are evicted once every this many stores
+EVICT_EVERY = 64
+
+
+class LLMCacheMiss(LookupError):
+    """Raised in replay_only mode when a prompt has no recorded response."""
+
+
+class SQLiteLLMCache(BaseCache):
+    """LangChain cache storing chat generations in SQLite with TTL and LRU eviction."""
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = READ_THROUGH,
+        ttl_seconds: Optional[float] = None,
+        max_size_bytes: Optional[int] = None,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unsupported LLM cache mode: {mode}")
+
+        self.path = path
+        self.mode = mode
+        self.ttl_seconds = ttl_seconds or None
+        self.max_size_bytes = max_size_bytes or None
+        self._local = threading.local()
+        self._stores = itertools.count()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_by_access ON responses (accessed)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite connections must not be shared across threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        digest = hashlib.sha256(llm_string.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(prompt.encode("utf-8"))
+        return digest.hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        if self.mode in (OFF, RECORD_ONLY):
+            return None
+
+        key = self._key(prompt, llm_string)
+        now = time.time()
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT value, created FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is not None and self.ttl_seconds and row[1] + self.ttl_seconds < now:
+            with conn:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            row = None
+
+        if row is None:
+            if self.mode == REPLAY_ONLY:
+                raise LLMCacheMiss(f"No recorded LLM response for key {key}")
+            return None
+
+        with conn:
+            conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        return _loads(row[0])
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        if self.mode in (OFF, REPLAY_ONLY):
+            return
+
+        value = _dumps(return_val)
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (self._key(prompt, llm_string), value, len(value), now, now),
+            )
+            if next(self._stores) % EVICT_EVERY == 0:
+                self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        if self.ttl_seconds:
+            conn.execute(
+                "DELETE FROM responses WHERE created < ?", (now - self.ttl_seconds,)
+            )
+        if self.max_size_bytes:
+            # Keep the most recently used entries that fit in the size budget
+            conn.execute(
+                """
+                DELETE FROM responses WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, SUM(size) OVER (
+                            ORDER BY accessed DESC, key
+                        ) AS running FROM responses
+                    ) WHERE running > ?
+                )
+                """,
+                (self.max_size_bytes,),
+            )
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, int]:
+        entries, size = self._connect().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        return {"entries": entries, "size_bytes": size}
+
+
+def _dumps(generations: Sequence[Generation]) -> str:
+    payload = []
+    for generation in generations:
+        entry = {"text": generation.text, "generation_info": generation.generation_info}
+        if isinstance(generation, ChatGeneration):
+            entry["message"] = message_to_dict(generation.message)
+        payload.append(entry)
+    return json.dumps(payload, ensure_ascii=False)
+
+
+def _loads(value: str) -> RETURN_VAL_TYPE:
+    generations = []
+    for entry in json.loads(value):
+        if "message" in entry:
+            generations.append(
+                ChatGeneration(
+                    message=messages_from_dict([entry["message"]])[0],
+                    generation_info=entry["generation_info"],
+                )
+            )
+        else:
+            generations.append(
+                Generation(text=entry["text"], generation_info=entry["generation_info"])
+            )
+    return generations
+
+
+# Keyed by (path, mode, ttl_seconds, max_size_bytes)
+_caches: Dict[tuple, SQLiteLLMCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_llm_cache(config: Dict[str, Any]) -> Optional[SQLiteLLMCache]:
+    """Return the shared LLM response cache for a config, or None if caching is off."""
+    mode = config.get("llm_cache_mode", OFF)
+    if mode == OFF:
+        return None
+
+    path = os.path.abspath(os.path.join(get_data_cache_dir(config), "llm_cache.sqlite"))
+    ttl_days = config.get("llm_cache_ttl_days")
+    max_size_mb = config.get("llm_cache_max_size_mb")
+    ttl_seconds = ttl_days * 86400 if ttl_days else None
+    max_size_bytes = int(max_size_mb * 1024 * 1024) if max_size_mb else None
+    settings = (path, mode, ttl_seconds, max_size_bytes)
+
+    with _caches_lock:
+        cache = _caches.get(settings)
+        if cache is None:
+            cache = SQLiteLLMCache(
+                path, mode=mode, ttl_seconds=ttl_seconds, max_size_bytes=max_size_bytes
+            )
+            _caches[settings] = cache
+    return cache